@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import List, Dict
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -9,13 +9,14 @@ from sqlalchemy.orm import Session
 
 from chain_processor_db.session import get_db
 from chain_processor_db.models.chain import ChainStrategy, StrategyNode
-from chain_processor_db.models.execution import ChainExecution, NodeExecution, ExecutionStatus
+from chain_processor_db.models.execution import ChainExecution, ExecutionStatus
 from chain_processor_db.repositories.chain_repo import ChainRepository
 from chain_processor_db.repositories.node_repo import NodeRepository
 from chain_processor_db.repositories.execution_repo import ExecutionRepository
 
 from chain_processor_core.executor.chain_executor import ChainExecutor
 from chain_processor_core.exceptions.errors import ChainProcessorError
+from chain_processor_core.utils.serialization import from_orm_fast
 
 from ..schemas import (
     ChainCreate, 
@@ -52,16 +53,8 @@ def create_chain(chain_in: ChainCreate, db: Session = Depends(get_db)) -> ChainR
 def list_chains(db: Session = Depends(get_db)) -> List[ChainRead]:
     repo = ChainRepository(db)
     chains = repo.get_all()
-    return [
-        ChainRead(
-            id=c.id,
-            name=c.name,
-            description=c.description,
-            tags=c.tags,
-            version=c.version,
-        )
-        for c in chains
-    ]
+    # Rows come from our own database, so skip validating them again
+    return [from_orm_fast(ChainRead, c) for c in chains]
 
 
 @router.post("/{chain_id}/nodes", status_code=status.HTTP_201_CREATED)
@@ -108,6 +101,7 @@ def add_node_to_chain(
             position=node_request.position,
             config=node_request.config,
         )
+        db.commit()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -167,7 +161,7 @@ def execute_chain(
             with db.begin_nested():
                 chain_execution.status = ExecutionStatus.FAILED
                 chain_execution.error = f"Chain with ID {chain_id} has no nodes"
-                chain_execution.completed_at = datetime.utcnow()
+                chain_execution.completed_at = datetime.now(timezone.utc)
                 db.commit()
                 
             raise HTTPException(
@@ -208,7 +202,7 @@ def execute_chain(
             chain_execution.output_text = result.output_data
             chain_execution.error = result.error
             chain_execution.execution_time_ms = result.execution_time_ms
-            chain_execution.completed_at = datetime.utcnow()
+            chain_execution.completed_at = datetime.now(timezone.utc)
             db.flush()
             
             # Create node execution records
@@ -221,17 +215,16 @@ def execute_chain(
                     # Find the actual node ID from the map using the node name from result
                     node_id = node_name_to_id_map.get(node_result.node_id)
                     if node_id:
-                        node_exec = NodeExecution(
-                            execution_id=chain_execution.id,
-                            node_id=node_id,  # Use node ID from the map
-                            input_text=node_result.input_data,
-                            output_text=node_result.output_data,
-                            error=node_result.error,
-                            status=ExecutionStatus.SUCCESS if node_result.success else ExecutionStatus.FAILED,
-                            execution_time_ms=node_result.execution_time_ms,
-                            completed_at=datetime.utcnow() if node_result.output_data or node_result.error else None
-                        )
-                        node_executions.append(node_exec)
+                        node_executions.append({
+                            "execution_id": chain_execution.id,
+                            "node_id": node_id,  # Use node ID from the map
+                            "input_text": node_result.input_data,
+                            "output_text": node_result.output_data,
+                            "error": node_result.error,
+                            "status": ExecutionStatus.SUCCESS if node_result.success else ExecutionStatus.FAILED,
+                            "execution_time_ms": node_result.execution_time_ms,
+                            "completed_at": datetime.now(timezone.utc) if node_result.output_data or node_result.error else None,
+                        })
                     else:
                         print(f"Warning: Node ID mapping not found for {node_result.node_id}")
             else:
@@ -242,7 +235,7 @@ def execute_chain(
                 # Update chain execution
                 chain_execution.status = ExecutionStatus.FAILED
                 chain_execution.error = error_msg
-                chain_execution.completed_at = datetime.utcnow()
+                chain_execution.completed_at = datetime.now(timezone.utc)
                 db.commit()
                 
                 # Return error response
@@ -251,10 +244,12 @@ def execute_chain(
                     detail=f"Internal processing error: {error_msg}"
                 )
             
-            # Add all node executions in a single operation
+            # Insert all node executions in batched multi-row INSERTs
             if node_executions:
-                db.add_all(node_executions)
-                db.commit()
+                execution_repo.create_node_executions(node_executions)
+        
+        # Commit the execution result and its node executions together
+        db.commit()
         
         # Create the response
         node_results = [
@@ -286,7 +281,7 @@ def execute_chain(
         # Update the chain execution record with the error
         chain_execution.status = ExecutionStatus.FAILED
         chain_execution.error = str(e)
-        chain_execution.completed_at = datetime.utcnow()
+        chain_execution.completed_at = datetime.now(timezone.utc)
         db.commit()
         
         raise HTTPException(
@@ -297,7 +292,7 @@ def execute_chain(
         # Update the chain execution record with the error
         chain_execution.status = ExecutionStatus.FAILED
         chain_execution.error = f"Unexpected error: {str(e)}"
-        chain_execution.completed_at = datetime.utcnow()
+        chain_execution.completed_at = datetime.now(timezone.utc)
         db.commit()
         
         raise HTTPException(
@@ -40,12 +40,13 @@ def list_executions(
     """
     repo = ExecutionRepository(db)
     
+    # Summary rows skip the columns and ORM bookkeeping the list view doesn't use
     if strategy_id:
-        executions = repo.get_by_strategy(strategy_id, limit=limit, offset=offset)
+        executions = repo.get_summaries(strategy_id=strategy_id, limit=limit, offset=offset)
     elif status:
-        executions = repo.get_by_status(status, limit=limit, offset=offset)
+        executions = repo.get_summaries(status=status, limit=limit, offset=offset)
     else:
-        executions = repo.get_all(limit=limit, offset=offset)
+        executions = repo.get_summaries(limit=limit, offset=offset)
     
     return [
         ChainExecuteResponse(
@@ -13,6 +13,7 @@ from chain_processor_db.session import get_db
 from chain_processor_db.models.node import Node
 from chain_processor_db.repositories.node_repo import NodeRepository
 from chain_processor_core.lib_chains.registry import default_registry
+from chain_processor_core.utils.serialization import from_orm_fast
 
 from ..schemas import NodeRead, PaginatedResponse
 
@@ -40,6 +41,8 @@ def list_nodes(
         Paginated list of nodes
     """
     repo = NodeRepository(db)
+    # An empty ?tag= means no filter, for the count and the page alike
+    tag = tag or None
     
     # Get total count
     total = repo.count(tag=tag)
@@ -48,23 +51,11 @@ def list_nodes(
     page = (offset // limit) + 1
     total_pages = math.ceil(total / limit) if total > 0 else 1
     
-    # Get paginated results
-    if tag:
-        nodes = repo.get_by_tag(tag, limit=limit, offset=offset)
-    else:
-        nodes = repo.get_all(limit=limit, offset=offset)
+    # Get paginated summary rows; the list view never needs node code
+    nodes = repo.get_summaries(tag=tag, limit=limit, offset=offset)
     
-    # Convert to response model
-    items = [
-        NodeRead(
-            id=n.id,
-            name=n.name,
-            description=n.description,
-            tags=n.tags,
-            version=n.version,
-        )
-        for n in nodes
-    ]
+    # Convert to response model; rows come from our own database, so skip validation
+    items = [from_orm_fast(NodeRead, n) for n in nodes]
     
     # Create pagination response
     return PaginatedResponse[NodeRead](
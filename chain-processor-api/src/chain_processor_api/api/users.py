@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from chain_processor_db.session import get_db
 from chain_processor_db.models.user import User
 from chain_processor_db.repositories.user_repo import UserRepository
+from chain_processor_core.utils.serialization import from_orm_fast
 
 from ..schemas import UserCreate, UserRead
 
@@ -48,15 +49,6 @@ def create_user(user_in: UserCreate, db: Session = Depends(get_db)) -> UserRead:
 @router.get("/", response_model=List[UserRead])
 def list_users(db: Session = Depends(get_db)) -> List[UserRead]:
     repo = UserRepository(db)
-    users = repo.get_all()
-    return [
-        UserRead(
-            id=u.id,
-            email=u.email,
-            full_name=u.full_name,
-            roles=u.roles,
-            is_active=u.is_active,
-            version=u.version,
-        )
-        for u in users
-    ]
+    users = repo.get_summaries()
+    # Rows come from our own database, so skip validating them again
+    return [from_orm_fast(UserRead, u) for u in users]
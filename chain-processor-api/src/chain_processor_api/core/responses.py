@@ -0,0 +1,15 @@
+"""Response classes for the Chain Processor API."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from chain_processor_core.utils.serialization import json_dumps_bytes
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson via ``json_dumps_bytes``."""
+
+    def render(self, content: Any) -> bytes:
+        """Render the content straight to JSON bytes."""
+        return json_dumps_bytes(content)
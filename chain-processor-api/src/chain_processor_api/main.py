@@ -3,10 +3,10 @@
 import logging
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from .api.router import api_router
 from .core.config import settings
+from .core.responses import ORJSONResponse
 from chain_processor_core.exceptions.errors import ChainProcessorError
 
 # Import to ensure nodes are registered
@@ -27,6 +27,7 @@ app = FastAPI(
     title="Chain Processor API",
     description="API for the Chain Processor system",
     version="1.2.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -43,9 +44,9 @@ app.include_router(api_router, prefix="/api")
 @app.exception_handler(ChainProcessorError)
 async def chain_processor_exception_handler(
     request: Request, exc: ChainProcessorError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Chain Processor specific errors."""
-    return JSONResponse(status_code=400, content={"detail": str(exc)})
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
 
 
 @app.get("/health")
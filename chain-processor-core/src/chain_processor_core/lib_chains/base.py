@@ -60,6 +60,16 @@ class TextChainNode(ChainNode[str, str]):
     This class implements the ChainNode interface for text-based nodes.
     """
 
+    # False when a subclass overrides validate_input, so nodes that check
+    # their input inline know they must call it for every input
+    _default_validate_input = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._default_validate_input = (
+            cls.validate_input.__func__ is TextChainNode.validate_input.__func__  # type: ignore[attr-defined]
+        )
+
     @classmethod
     def validate_input(cls, input_text: str) -> None:
         """
@@ -124,7 +134,10 @@ class FunctionNode(TextChainNode):
         Returns:
             The transformed output text
         """
-        self.validate_input(input_text)
+        # Only take the validate_input lookup when the cheap check fails,
+        # unless a subclass overrides it
+        if not self._default_validate_input or type(input_text) is not str or not input_text:
+            self.validate_input(input_text)
         return self.func(input_text)
 
 
@@ -45,4 +45,4 @@ class VersionedModel(TimestampedModel):
         """Ensure the version is positive."""
         if v < 1:
             raise ValueError("Version must be a positive integer")
-        return v 
\ No newline at end of file
+        return v
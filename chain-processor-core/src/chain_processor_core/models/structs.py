@@ -0,0 +1,31 @@
+"""
+msgspec base structs for the Chain Processing System.
+
+This module defines msgspec counterparts of the base models in ``base``.
+It is kept separate so that importing the models does not import msgspec.
+"""
+
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID, uuid4
+
+import msgspec
+
+
+class BaseStructWithId(msgspec.Struct, frozen=True, kw_only=True):
+    """msgspec counterpart of ``BaseModelWithId`` for JSON-only DTOs."""
+
+    id: UUID = msgspec.field(default_factory=uuid4)
+
+
+class TimestampedStruct(BaseStructWithId, frozen=True, kw_only=True):
+    """msgspec counterpart of ``TimestampedModel``."""
+
+    created_at: datetime = msgspec.field(default_factory=datetime.utcnow)
+    updated_at: datetime = msgspec.field(default_factory=datetime.utcnow)
+
+
+class VersionedStruct(TimestampedStruct, frozen=True, kw_only=True):
+    """msgspec counterpart of ``VersionedModel``."""
+
+    version: Annotated[int, msgspec.Meta(ge=1)] = 1
@@ -5,7 +5,7 @@ This module defines the models for users and authentication.
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Literal
+from typing import List, Optional, Dict, Any
 from uuid import UUID
 
 from pydantic import Field, field_validator, EmailStr
@@ -20,6 +20,22 @@ class Role(str):
     VIEWER = "viewer"
 
 
+_ROLES: frozenset[str] = frozenset({Role.ADMIN, Role.EDITOR, Role.VIEWER})
+
+
+def _default_roles() -> List[str]:
+    """Return a fresh default role list."""
+    return [Role.VIEWER]
+
+
+def _check_roles(roles: List[str]) -> List[str]:
+    """Reject any role that is not a known ``Role`` value."""
+    bad = set(roles) - _ROLES
+    if bad:
+        raise ValueError(f"Invalid roles: {', '.join(sorted(bad))}")
+    return roles
+
+
 class User(VersionedModel):
     """User model."""
 
@@ -27,10 +43,16 @@ class User(VersionedModel):
     email: EmailStr
     full_name: Optional[str] = None
     is_active: bool = True
-    roles: List[Literal["admin", "editor", "viewer"]] = Field(default_factory=lambda: ["viewer"])
+    roles: List[str] = Field(default_factory=_default_roles)
     last_login: Optional[datetime] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    @field_validator("roles")
+    @classmethod
+    def validate_roles(cls, v: List[str]) -> List[str]:
+        """Validate that every role is a known role."""
+        return _check_roles(v)
+
     @field_validator("username")
     @classmethod
     def validate_username(cls, v: str) -> str:
@@ -51,7 +73,7 @@ class UserCreate(VersionedModel):
     email: EmailStr
     password: str
     full_name: Optional[str] = None
-    roles: List[Literal["admin", "editor", "viewer"]] = Field(default_factory=lambda: ["viewer"])
+    roles: List[str] = Field(default_factory=_default_roles)
 
     @field_validator("password")
     @classmethod
@@ -67,6 +89,12 @@ class UserCreate(VersionedModel):
             raise ValueError("Password must contain at least one digit")
         return v
 
+    @field_validator("roles")
+    @classmethod
+    def validate_roles(cls, v: List[str]) -> List[str]:
+        """Validate that every role is a known role."""
+        return _check_roles(v)
+
 
 class UserUpdate(VersionedModel):
     """Model for updating a user."""
@@ -74,7 +102,15 @@ class UserUpdate(VersionedModel):
     email: Optional[EmailStr] = None
     full_name: Optional[str] = None
     is_active: Optional[bool] = None
-    roles: Optional[List[Literal["admin", "editor", "viewer"]]] = None
+    roles: Optional[List[str]] = None
+
+    @field_validator("roles")
+    @classmethod
+    def validate_roles(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate that every role is a known role."""
+        if v is None:
+            return v
+        return _check_roles(v)
 
 
 class Token(VersionedModel):
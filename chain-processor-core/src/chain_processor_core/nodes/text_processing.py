@@ -2,6 +2,11 @@
 Basic text processing nodes.
 
 This module provides simple text transformation nodes.
+
+The class-based nodes check for a non-empty ``str`` inline and only fall
+back to ``validate_input`` (which builds the error message) when that
+check fails, keeping the success path free of extra calls. Subclasses
+that override ``validate_input`` have it called for every input.
 """
 
 from ..lib_chains.base import TextChainNode
@@ -22,7 +27,8 @@ class UppercaseNode(TextChainNode):
         Returns:
             The uppercase version of the input text
         """
-        self.validate_input(input_text)
+        if not self._default_validate_input or type(input_text) is not str or not input_text:
+            self.validate_input(input_text)
         return input_text.upper()
 
 
@@ -40,7 +46,8 @@ class LowercaseNode(TextChainNode):
         Returns:
             The lowercase version of the input text
         """
-        self.validate_input(input_text)
+        if not self._default_validate_input or type(input_text) is not str or not input_text:
+            self.validate_input(input_text)
         return input_text.lower()
 
 
@@ -58,7 +65,8 @@ class ReverseTextNode(TextChainNode):
         Returns:
             The reversed input text
         """
-        self.validate_input(input_text)
+        if not self._default_validate_input or type(input_text) is not str or not input_text:
+            self.validate_input(input_text)
         return input_text[::-1]
 
 
@@ -5,15 +5,52 @@ This module provides utilities for serializing and deserializing data.
 """
 
 import json
+import dataclasses
+import sys
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union, TypeVar, Type, cast
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING, Annotated, Any, Callable, Dict, List, Optional, Tuple, Union, TypeVar, Type,
+    cast, get_args, get_origin, overload,
+)
 from uuid import UUID
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, PlainSerializer, TypeAdapter, WrapSerializer
+from pydantic.fields import FieldInfo
+
+# msgspec is only needed once structs are involved, so it is imported lazily
+if TYPE_CHECKING:
+    import msgspec
 
 T = TypeVar('T', bound=BaseModel)
+S = TypeVar('S', bound="msgspec.Struct")
+
+# Converters keyed by exact type; subclasses are added on first sight
+_EXACT: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    UUID: str,
+    Decimal: float,
+}
+
+# Base-class converters, checked in order for types not yet in _EXACT
+_BASES: Tuple[Tuple[type, Callable[[Any], Any]], ...] = (
+    (date, lambda obj: obj.isoformat()),  # datetime is a date subclass
+    (UUID, str),
+    (Decimal, float),
+    (Enum, lambda obj: obj.value),
+    (BaseModel, lambda obj: obj.model_dump()),
+)
+
+
+def _is_struct_class(cls: type) -> bool:
+    """Check for a msgspec struct class without importing msgspec."""
+    # If msgspec was never imported, no struct classes can exist yet
+    msgspec = sys.modules.get("msgspec")
+    return msgspec is not None and issubclass(cls, msgspec.Struct)
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -29,22 +66,46 @@ class CustomJSONEncoder(json.JSONEncoder):
         Returns:
             A JSON-serializable representation of the object
         """
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, Decimal):
-            return float(obj)
-        if isinstance(obj, Enum):
-            return obj.value
-        if isinstance(obj, BaseModel):
-            return obj.model_dump()
-        return super().default(obj)
+        cls = type(obj)
+        fn = _EXACT.get(cls)
+        if fn is None:
+            for base, converter in _BASES:
+                if issubclass(cls, base):
+                    fn = _EXACT[cls] = converter
+                    break
+            else:
+                return super().default(obj)
+        return fn(obj)
+
+
+_ENCODER = CustomJSONEncoder()
+_DEFAULT = _ENCODER.default
+_DUMPS_OPTION = orjson.OPT_NON_STR_KEYS
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+
+    orjson encodes datetimes, UUIDs and enums natively and only calls back
+    into ``CustomJSONEncoder.default`` for the remaining types. Prefer this
+    over ``json_dumps`` when the result is written to a socket or response.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        The JSON document as bytes
+    """
+    return orjson.dumps(obj, default=_DEFAULT, option=_DUMPS_OPTION)
 
 
 def json_dumps(obj: Any, **kwargs: Any) -> str:
     """
     Serialize an object to a JSON string.
+
+    Passing any json.dumps options (e.g. ``indent``) uses the stdlib encoder;
+    otherwise this decodes the output of ``json_dumps_bytes``.
     
     Args:
         obj: The object to serialize
@@ -53,12 +114,16 @@ def json_dumps(obj: Any, **kwargs: Any) -> str:
     Returns:
         The JSON string
     """
-    return json.dumps(obj, cls=CustomJSONEncoder, **kwargs)
+    if kwargs:
+        return json.dumps(obj, cls=CustomJSONEncoder, **kwargs)
+    return json_dumps_bytes(obj).decode()
 
 
-def json_loads(data: str, **kwargs: Any) -> Any:
+def json_loads(data: Union[str, bytes], **kwargs: Any) -> Any:
     """
     Deserialize a JSON string to an object.
+
+    Uses orjson unless json.loads options (e.g. ``object_hook``) are given.
     
     Args:
         data: The JSON string to deserialize
@@ -67,13 +132,93 @@ def json_loads(data: str, **kwargs: Any) -> Any:
     Returns:
         The deserialized object
     """
-    return json.loads(data, **kwargs)
+    if kwargs:
+        return json.loads(data, **kwargs)
+    return orjson.loads(data)
+
+
+# Container types whose items model_dump may convert
+_CONTAINERS = (list, dict, set, frozenset, tuple)
+
+
+def _is_plain_annotation(annotation: Any) -> bool:
+    """Return True if values of this type are dumped by model_dump unchanged."""
+    # Values typed as Any may hold models, which model_dump would convert
+    if annotation is Any or annotation is object or isinstance(annotation, TypeVar):
+        return False
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        # Inner metadata may carry a serializer
+        return False
+    args = get_args(annotation)
+    if origin is None and isinstance(annotation, type):
+        if issubclass(annotation, BaseModel) or dataclasses.is_dataclass(annotation):
+            return False
+        # A bare container's items are untyped
+        return not issubclass(annotation, _CONTAINERS)
+    if not args and origin in _CONTAINERS:
+        return False
+    return all(_is_plain_annotation(arg) for arg in args)
+
+
+def _is_plain_field(field: FieldInfo) -> bool:
+    """Return True if model_dump copies this field's value without converting it."""
+    return (
+        not field.exclude
+        and field.exclude_if is None
+        and not any(
+            isinstance(item, (PlainSerializer, WrapSerializer)) for item in field.metadata
+        )
+        and _is_plain_annotation(field.annotation)
+    )
+
+
+def _copy_plain(value: Any) -> Any:
+    """Copy the containers in a plain field value, as model_dump does."""
+    cls = type(value)
+    if cls is list:
+        return [_copy_plain(item) for item in value]
+    if cls is dict:
+        return {key: _copy_plain(item) for key, item in value.items()}
+    if cls is set:
+        return {_copy_plain(item) for item in value}
+    if cls is tuple:
+        return tuple(_copy_plain(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=128)
+def _plain_field_names(model_class: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Get the field names of a model whose dump is a plain attribute copy.
+    
+    Args:
+        model_class: The model class to inspect
+        
+    Returns:
+        The field names, or None if the class needs a full model_dump
+        (nested or Any-typed values, excluded fields, custom serializers,
+        computed or extra fields)
+    """
+    decorators = model_class.__pydantic_decorators__
+    if (
+        model_class.model_computed_fields
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or model_class.model_config.get("extra") == "allow"
+        or not all(_is_plain_field(field) for field in model_class.model_fields.values())
+    ):
+        return None
+    return tuple(model_class.model_fields)
 
 
 def serialize_model(model: BaseModel, exclude_none: bool = True) -> Dict[str, Any]:
     """
     Serialize a Pydantic model to a dictionary.
     
+    Flat models are dumped by reading their fields directly; the output
+    matches ``model_dump``.
+    
     Args:
         model: The model to serialize
         exclude_none: Whether to exclude None values
@@ -81,32 +226,228 @@ def serialize_model(model: BaseModel, exclude_none: bool = True) -> Dict[str, An
     Returns:
         The serialized model as a dictionary
     """
-    return model.model_dump(exclude_none=exclude_none)
+    names = _plain_field_names(type(model))
+    if names is None:
+        return model.model_dump(exclude_none=exclude_none)
+    values = model.__dict__
+    if exclude_none:
+        return {
+            name: _copy_plain(value) for name in names if (value := values[name]) is not None
+        }
+    return {name: _copy_plain(values[name]) for name in names}
 
 
-def deserialize_model(model_class: Type[T], data: Dict[str, Any]) -> T:
+def deserialize_model(model_class: Type[T], data: Dict[str, Any], *, validate: bool = True) -> T:
     """
     Deserialize a dictionary to a Pydantic model.
     
     Args:
         model_class: The model class to deserialize to
         data: The dictionary to deserialize
+        validate: Whether to run validation; pass False only for trusted
+            data (e.g. our own database rows) to use ``model_construct``
         
     Returns:
         The deserialized model
     """
+    if not validate:
+        return model_class.model_construct(**data)
     return model_class.model_validate(data)
 
 
-def deserialize_models(model_class: Type[T], data_list: List[Dict[str, Any]]) -> List[T]:
+@lru_cache(maxsize=128)
+def _field_names(model_class: type) -> Tuple[str, ...]:
+    """Get the field names of a model class."""
+    return tuple(model_class.model_fields)  # type: ignore[attr-defined]
+
+
+def from_orm_fast(model_class: Type[T], obj: Any) -> T:
     """
-    Deserialize a list of dictionaries to a list of Pydantic models.
+    Build a Pydantic model from a trusted object's attributes without validation.
+    
+    Meant for converting database rows into response models; use
+    ``deserialize_model`` for anything that comes from outside.
+    
+    Args:
+        model_class: The model class to build
+        obj: The object whose attributes hold the field values
+        
+    Returns:
+        The constructed model
+    """
+    return model_class.model_construct(
+        **{name: getattr(obj, name) for name in _field_names(model_class)}
+    )
+
+
+@overload
+def deserialize_models(
+    model_class: Type[S], data_list: List[Dict[str, Any]], *, validate: bool = True
+) -> List[S]: ...
+
+
+@overload
+def deserialize_models(
+    model_class: Type[T], data_list: List[Dict[str, Any]], *, validate: bool = True
+) -> List[T]: ...
+
+
+def deserialize_models(
+    model_class: Type[Any], data_list: List[Dict[str, Any]], *, validate: bool = True
+) -> List[Any]:
+    """
+    Deserialize a list of dictionaries to a list of models.
+
+    ``msgspec.Struct`` classes are converted in a single msgspec call;
+    Pydantic models are validated one by one.
     
     Args:
         model_class: The model class to deserialize to
         data_list: The list of dictionaries to deserialize
+        validate: Whether to validate Pydantic models; pass False only for
+            trusted data. Structs are always checked by msgspec.
+        
+    Returns:
+        The list of deserialized models
+    """
+    if _is_struct_class(model_class):
+        import msgspec
+
+        return cast(List[Any], msgspec.convert(data_list, type=List[model_class]))  # type: ignore[valid-type]
+    if not validate:
+        construct = model_class.model_construct
+        return [construct(**item) for item in data_list]
+    return [deserialize_model(model_class, item) for item in data_list]
+
+
+@lru_cache(maxsize=128)
+def _list_decoder(model_class: type) -> Callable[[Union[str, bytes]], List[Any]]:
+    """
+    Build a decoder that parses a JSON array straight into a list of models.
+    
+    Args:
+        model_class: A msgspec struct or Pydantic model class
+        
+    Returns:
+        The decode function for that class
+    """
+    if _is_struct_class(model_class):
+        import msgspec
+
+        return msgspec.json.Decoder(List[model_class]).decode  # type: ignore[valid-type]
+    return TypeAdapter(List[model_class]).validate_json  # type: ignore[valid-type]
+
+
+@overload
+def deserialize_models_from_json(model_class: Type[S], data: Union[str, bytes]) -> List[S]: ...
+
+
+@overload
+def deserialize_models_from_json(model_class: Type[T], data: Union[str, bytes]) -> List[T]: ...
+
+
+def deserialize_models_from_json(model_class: type, data: Union[str, bytes]) -> List[Any]:
+    """
+    Deserialize a JSON array to a list of models in a single native call.
+    
+    Args:
+        model_class: The msgspec struct or Pydantic model class to deserialize to
+        data: The JSON array to deserialize
         
     Returns:
         The list of deserialized models
     """
-    return [deserialize_model(model_class, item) for item in data_list] 
\ No newline at end of file
+    return _list_decoder(model_class)(data)
+
+
+@lru_cache(maxsize=1)
+def _struct_encoder() -> Callable[[Any], bytes]:
+    """Get the shared msgspec encoder; encoders are type-agnostic."""
+    import msgspec
+
+    return msgspec.json.Encoder().encode
+
+
+@lru_cache(maxsize=128)
+def _struct_decoder(struct_class: type) -> Callable[[Union[str, bytes]], Any]:
+    """
+    Build a decoder for a struct class.
+    
+    Args:
+        struct_class: The struct class to decode to
+        
+    Returns:
+        The decode function for that class
+    """
+    import msgspec
+
+    return msgspec.json.Decoder(struct_class).decode
+
+
+def serialize_struct(struct: "msgspec.Struct") -> bytes:
+    """
+    Serialize a msgspec struct to JSON bytes.
+
+    Args:
+        struct: The struct to serialize
+
+    Returns:
+        The JSON document as bytes
+    """
+    return _struct_encoder()(struct)
+
+
+def deserialize_struct(struct_class: Type[S], data: Union[str, bytes]) -> S:
+    """
+    Deserialize JSON to a msgspec struct, validating it against the schema.
+
+    Args:
+        struct_class: The struct class to deserialize to
+        data: The JSON document to deserialize
+
+    Returns:
+        The deserialized struct
+    """
+    return cast(S, _struct_decoder(struct_class)(data))
+
+
+def fast_dump(obj: Union[BaseModel, "msgspec.Struct"]) -> bytes:
+    """
+    Serialize a Pydantic model or msgspec struct to JSON bytes.
+
+    Structs use the shared msgspec encoder; models go through
+    ``serialize_model`` and orjson, matching ``json_dumps``.
+
+    Args:
+        obj: The model or struct to serialize
+
+    Returns:
+        The JSON document as bytes
+    """
+    if _is_struct_class(type(obj)):
+        return _struct_encoder()(obj)
+    return json_dumps_bytes(serialize_model(cast(BaseModel, obj)))
+
+
+@overload
+def fast_load(model_class: Type[S], data: Union[str, bytes]) -> S: ...
+
+
+@overload
+def fast_load(model_class: Type[T], data: Union[str, bytes]) -> T: ...
+
+
+def fast_load(model_class: type, data: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON to a Pydantic model or msgspec struct in one native call.
+
+    Args:
+        model_class: The model or struct class to deserialize to
+        data: The JSON document to deserialize
+
+    Returns:
+        The deserialized model or struct
+    """
+    if _is_struct_class(model_class):
+        return _struct_decoder(model_class)(data)
+    return model_class.model_validate_json(data)  # type: ignore[attr-defined]
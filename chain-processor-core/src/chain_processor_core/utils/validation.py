@@ -5,15 +5,41 @@ This module provides utilities for validating input data.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Callable, Union, Pattern
 from uuid import UUID
 
 from ..exceptions.errors import InvalidInputError
 
 
-def validate_uuid(uuid_str: str, field_name: str = "ID") -> UUID:
+_UUID_RE = re.compile(
+    r'\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z'
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_uuid(uuid_str: str) -> UUID:
+    """Parse a UUID string, memoizing results for repeated IDs."""
+    return UUID(uuid_str)
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """Compile a regex pattern, memoizing results for repeated patterns."""
+    return re.compile(pattern)
+
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^(https?|ftp)://[^\s/$.?#].[^\s]*$')
+
+
+# Hot builtins and constructors are bound as keyword-only defaults below so
+# they resolve as fast locals rather than global lookups on every call.
+def validate_uuid(uuid_str: str, field_name: str = "ID",
+                  *, _parse: Callable[[str], UUID] = _parse_uuid,
+                  _match: Callable[[str], Any] = _UUID_RE.match) -> UUID:
     """
-    Validate that a string is a valid UUID.
+    Validate that a string is a valid UUID in canonical hyphenated form.
     
     Args:
         uuid_str: The string to validate
@@ -25,16 +51,17 @@ def validate_uuid(uuid_str: str, field_name: str = "ID") -> UUID:
     Raises:
         InvalidInputError: If the string is not a valid UUID
     """
-    try:
-        return UUID(uuid_str)
-    except (ValueError, AttributeError, TypeError):
+    # Reject bad input with a regex match instead of letting UUID() raise
+    if not isinstance(uuid_str, str) or not _match(uuid_str):
         raise InvalidInputError(f"{field_name} must be a valid UUID")
+    return _parse(uuid_str)
 
 
 def validate_text(text: str, min_length: Optional[int] = None, 
                  max_length: Optional[int] = None, 
-                 pattern: Optional[Union[str, Pattern]] = None,
-                 field_name: str = "Text") -> str:
+                 pattern: Optional[Union[str, Pattern[str]]] = None,
+                 field_name: str = "Text",
+                 *, _compile: Callable[[str], Pattern[str]] = _compile_pattern) -> str:
     """
     Validate text input.
     
@@ -62,7 +89,7 @@ def validate_text(text: str, min_length: Optional[int] = None,
         
     if pattern is not None:
         if isinstance(pattern, str):
-            pattern = re.compile(pattern)
+            pattern = _compile(pattern)
         if not pattern.match(text):
             raise InvalidInputError(f"{field_name} must match the required pattern")
             
@@ -113,8 +140,7 @@ def validate_email(email: str, field_name: str = "Email") -> str:
     Raises:
         InvalidInputError: If the email is invalid
     """
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return validate_text(email, pattern=email_pattern, field_name=field_name)
+    return validate_text(email, pattern=_EMAIL_RE, field_name=field_name)
 
 
 def validate_url(url: str, field_name: str = "URL") -> str:
@@ -131,5 +157,4 @@ def validate_url(url: str, field_name: str = "URL") -> str:
     Raises:
         InvalidInputError: If the URL is invalid
     """
-    url_pattern = r'^(https?|ftp)://[^\s/$.?#].[^\s]*$'
-    return validate_text(url, pattern=url_pattern, field_name=field_name) 
\ No newline at end of file
+    return validate_text(url, pattern=_URL_RE, field_name=field_name) 
\ No newline at end of file
@@ -12,6 +12,10 @@ from chain_processor_core.models.node import Node, NodeParameter
 from chain_processor_core.models.execution import ChainExecution, NodeExecution
 from chain_processor_core.models.user import User
 
+# Fixed reference time so fixtures don't hit the clock on every test
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_FIXED_LAST_LOGIN = _FIXED_NOW - timedelta(hours=1)
+
 
 @pytest.fixture
 def sample_node():
@@ -62,7 +66,7 @@ def sample_chain_execution(sample_strategy):
         strategy_id=sample_strategy.id,
         input_text="Hello, world!",
         status="pending",
-        started_at=datetime.utcnow(),
+        started_at=_FIXED_NOW,
         created_by=uuid4(),
         metadata={"source": "test"}
     )
@@ -77,7 +81,7 @@ def sample_node_execution(sample_chain_execution, sample_node):
         node_id=sample_node.id,
         input_text="Hello, world!",
         status="pending",
-        started_at=datetime.utcnow()
+        started_at=_FIXED_NOW
     )
 
 
@@ -90,5 +94,5 @@ def sample_user():
         email="test@example.com",
         full_name="Test User",
         roles=["admin", "editor"],
-        last_login=datetime.utcnow() - timedelta(hours=1)
+        last_login=_FIXED_LAST_LOGIN
     ) 
\ No newline at end of file
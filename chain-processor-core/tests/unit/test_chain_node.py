@@ -73,6 +73,20 @@ class TestChainNode:
         with pytest.raises(InvalidInputError):
             node.process("")
 
+    def test_function_node_uses_validate_input_override(self):
+        """Test that a FunctionNode subclass's validate_input runs for valid strings too."""
+        class ShortInputNode(FunctionNode):
+            @classmethod
+            def validate_input(cls, input_text):
+                super().validate_input(input_text)
+                if len(input_text) > 3:
+                    raise InvalidInputError("Input too long")
+
+        node = ShortInputNode(str.upper)
+        assert node.process("abc") == "ABC"
+        with pytest.raises(InvalidInputError):
+            node.process("abcd")
+
     def test_create_node_decorator(self):
         """Test create_node decorator."""
         # Create a node using the decorator
@@ -6,19 +6,33 @@ from uuid import uuid4
 from chain_processor_core.models.execution import ChainExecution
 
 
-def test_chain_execution_completion_and_timing():
-    """ChainExecution should populate completion fields on validation."""
-    start = datetime.utcnow() - timedelta(milliseconds=10)
+def test_chain_execution_timing_from_completed_at():
+    """ChainExecution should derive execution_time_ms from the given timestamps."""
+    start = datetime(2024, 1, 1, 12, 0, 0)
     execution = ChainExecution(
         strategy_id=uuid4(),
         input_text="test",
         status="success",
         started_at=start,
+        completed_at=start + timedelta(milliseconds=10),
     )
 
-    # Re-validate to trigger execution_time_ms calculation
-    execution = ChainExecution.model_validate(execution.model_dump())
+    assert execution.completed_at == start + timedelta(milliseconds=10)
+    assert execution.execution_time_ms == 10
+
+
+def test_chain_execution_populates_completed_at():
+    """ChainExecution should fill in completed_at for a terminal status."""
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    execution = ChainExecution(
+        strategy_id=uuid4(),
+        input_text="test",
+        status="success",
+        started_at=start,
+    )
 
     assert execution.completed_at is not None
-    assert execution.execution_time_ms is not None
-    assert execution.execution_time_ms >= 0
+    assert execution.completed_at > start
+    assert execution.execution_time_ms == int(
+        (execution.completed_at - start).total_seconds() * 1000
+    )
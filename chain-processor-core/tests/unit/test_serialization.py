@@ -3,23 +3,38 @@ Unit tests for serialization utilities.
 """
 
 import json
-from datetime import datetime, date
+from types import SimpleNamespace
+from datetime import datetime, date, timezone
 from decimal import Decimal
 from enum import Enum
+from typing import Annotated, Any, Dict, List, Optional
 from uuid import UUID
+import msgspec
 import pytest
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PlainSerializer, WrapSerializer
 
 from chain_processor_core.utils.serialization import (
     CustomJSONEncoder,
     json_dumps,
+    json_dumps_bytes,
     json_loads,
     serialize_model,
     deserialize_model,
     deserialize_models,
+    deserialize_models_from_json,
+    serialize_struct,
+    deserialize_struct,
+    fast_dump,
+    fast_load,
+    from_orm_fast,
 )
-from chain_processor_core.models.base import BaseModelWithId, TimestampedModel, VersionedModel
+from chain_processor_core.models.base import (
+    BaseModelWithId,
+    TimestampedModel,
+    VersionedModel,
+)
+from chain_processor_core.models.structs import VersionedStruct
 
 
 class SampleEnum(Enum):
@@ -80,6 +95,19 @@ class TestCustomJSONEncoder:
         result = encoder.default(model)
         assert result == {"name": "test", "value": 42}
 
+    def test_subclass_serialization(self):
+        """Test that subclasses of supported types use their own conversions."""
+        class SampleDateTime(datetime):
+            pass
+
+        encoder = CustomJSONEncoder()
+        dt = SampleDateTime(2023, 1, 1, 12, 0, 0)
+        # Repeat to exercise the cached lookup as well as the first dispatch
+        assert encoder.default(dt) == "2023-01-01T12:00:00"
+        assert encoder.default(dt) == "2023-01-01T12:00:00"
+        with pytest.raises(TypeError):
+            encoder.default(object())
+
 
 class TestJsonFunctions:
     """Test case for JSON serialization functions."""
@@ -89,7 +117,13 @@ class TestJsonFunctions:
         # Test with simple data
         data = {"name": "test", "value": 42}
         result = json_dumps(data)
-        assert result == '{"name": "test", "value": 42}'
+        assert isinstance(result, str)
+        assert json.loads(result) == data
+
+        # Test with stdlib options
+        result = json_dumps(data, indent=2)
+        assert json.loads(result) == data
+        assert "\n" in result
 
         # Test with complex data
         complex_data = {
@@ -109,6 +143,34 @@ class TestJsonFunctions:
         })
         assert json.loads(result) == json.loads(expected)
 
+    def test_json_dumps_bytes(self):
+        """Test json_dumps_bytes function."""
+        data = {
+            "uuid": UUID("123e4567-e89b-12d3-a456-426614174000"),
+            "decimal": Decimal("10.5"),
+            "model": SampleModel(name="test", value=42),
+        }
+        result = json_dumps_bytes(data)
+        assert isinstance(result, bytes)
+        assert json_loads(result) == {
+            "uuid": "123e4567-e89b-12d3-a456-426614174000",
+            "decimal": 10.5,
+            "model": {"name": "test", "value": 42},
+        }
+
+    def test_datetime_encoding_matches_isoformat(self):
+        """Test that orjson's native datetime output matches isoformat byte for byte."""
+        values = [
+            datetime(2023, 1, 1, 12, 0, 0),
+            datetime(2023, 1, 1, 12, 0, 0, 5),
+            datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            date(2023, 1, 1),
+        ]
+        for value in values:
+            expected = f'"{value.isoformat()}"'
+            assert json_dumps_bytes(value) == expected.encode()
+            assert json_dumps(value, sort_keys=True) == expected
+
     def test_json_loads(self):
         """Test json_loads function."""
         # Test with simple data
@@ -145,6 +207,75 @@ class TestModelSerialization:
         result = serialize_model(model, exclude_none=False)
         assert result == {"name": "test", "value": None}
 
+    def test_from_orm_fast(self):
+        """Test building a model from an object's attributes."""
+        row = SimpleNamespace(name="test", value=42, extra="ignored")
+        model = from_orm_fast(SampleModel, row)
+        assert model == SampleModel(name="test", value=42)
+        assert model.model_fields_set == {"name", "value"}
+
+    def test_serialize_nested_model(self):
+        """Test serialize_model matches model_dump for models it cannot copy directly."""
+        class Outer(BaseModel):
+            inner: SampleModel
+            items: List[SampleModel] = []
+            note: Optional[str] = None
+
+        model = Outer(inner=SampleModel(name="a", value=1), items=[SampleModel(name="b", value=2)])
+        assert serialize_model(model) == model.model_dump(exclude_none=True)
+        assert serialize_model(model, exclude_none=False) == model.model_dump()
+        assert serialize_model(model)["inner"] == {"name": "a", "value": 1}
+
+    def test_serialize_model_skips_excluded_fields(self):
+        """Test that fields declared with exclude=True are left out."""
+        class WithSecret(BaseModel):
+            name: str
+            secret: str = Field(exclude=True)
+
+        model = WithSecret(name="test", secret="s")
+        assert serialize_model(model) == {"name": "test"}
+        assert serialize_model(model) == model.model_dump(exclude_none=True)
+
+    def test_serialize_model_applies_annotated_serializers(self):
+        """Test that PlainSerializer and WrapSerializer metadata is applied."""
+        class WithSerializers(BaseModel):
+            x: Annotated[int, PlainSerializer(lambda v: v * 100)]
+            y: Annotated[int, WrapSerializer(lambda v, handler: handler(v) + 1)]
+            z: List[Annotated[int, PlainSerializer(str)]]
+
+        model = WithSerializers(x=2, y=2, z=[1])
+        assert serialize_model(model) == {"x": 200, "y": 3, "z": ["1"]}
+        assert serialize_model(model) == model.model_dump(exclude_none=True)
+
+    def test_serialize_model_dumps_models_in_any_fields(self):
+        """Test that models held in Any-typed fields are dumped to dicts."""
+        class WithAny(BaseModel):
+            value: Any
+            obj: object
+            meta: Dict[str, Any]
+            bare: dict
+
+        inner = SampleModel(name="a", value=1)
+        model = WithAny(value=inner, obj=inner, meta={"i": inner}, bare={"i": inner})
+        result = serialize_model(model)
+        assert result == model.model_dump(exclude_none=True)
+        assert result["value"] == {"name": "a", "value": 1}
+        assert result["meta"] == {"i": {"name": "a", "value": 1}}
+
+    def test_serialize_model_copies_containers(self):
+        """Test that the dump does not share containers with the model."""
+        class WithContainers(BaseModel):
+            tags: List[str]
+            scores: Dict[str, List[int]]
+
+        model = WithContainers(tags=["a"], scores={"x": [1]})
+        result = serialize_model(model)
+        assert result == model.model_dump(exclude_none=True)
+        result["tags"].append("b")
+        result["scores"]["x"].append(2)
+        assert model.tags == ["a"]
+        assert model.scores == {"x": [1]}
+
     def test_deserialize_model(self):
         """Test deserialize_model function."""
         # Test with simple model
@@ -170,6 +301,63 @@ class TestModelSerialization:
         assert result[1].name == "test2"
         assert result[1].value == 43
 
+    def test_deserialize_without_validation(self):
+        """Test the trusted no-validation path gives the same models."""
+        data = {"name": "test", "value": 42}
+        assert deserialize_model(SampleModel, data, validate=False) == deserialize_model(
+            SampleModel, data
+        )
+
+        data_list = [{"name": "test1", "value": 42}, {"name": "test2", "value": 43}]
+        assert deserialize_models(SampleModel, data_list, validate=False) == deserialize_models(
+            SampleModel, data_list
+        )
+
+        # Validation really is skipped
+        model = deserialize_model(SampleModel, {"name": "test", "value": "x"}, validate=False)
+        assert model.value == "x"
+
+
+class SampleStruct(VersionedStruct, frozen=True, kw_only=True):
+    """Sample struct for testing."""
+    name: str
+
+
+class TestStructSerialization:
+    """Test case for msgspec struct serialization functions."""
+
+    def test_struct_roundtrip(self):
+        """Test serialize_struct and deserialize_struct."""
+        struct = SampleStruct(name="test")
+        data = serialize_struct(struct)
+        assert isinstance(data, bytes)
+        assert deserialize_struct(SampleStruct, data) == struct
+
+    def test_struct_validation(self):
+        """Test that deserialize_struct enforces the schema."""
+        with pytest.raises(msgspec.ValidationError):
+            deserialize_struct(SampleStruct, b'{"name": "test", "version": 0}')
+        with pytest.raises(msgspec.ValidationError):
+            deserialize_struct(SampleStruct, b'{"version": 1}')
+
+    def test_deserialize_models_structs(self):
+        """Test deserialize_models with a struct class."""
+        first, second = SampleStruct(name="a"), SampleStruct(name="b")
+        data_list = [json_loads(serialize_struct(s)) for s in (first, second)]
+        result = deserialize_models(SampleStruct, data_list)
+        assert result == [first, second]
+
+    def test_deserialize_models_from_json(self):
+        """Test decoding a JSON array straight into structs and models."""
+        structs = [SampleStruct(name="a"), SampleStruct(name="b")]
+        assert deserialize_models_from_json(SampleStruct, serialize_struct(structs)) == structs
+
+        payload = b'[{"name": "test1", "value": 42}, {"name": "test2", "value": 43}]'
+        assert deserialize_models_from_json(SampleModel, payload) == [
+            SampleModel(name="test1", value=42),
+            SampleModel(name="test2", value=43),
+        ]
+
 
 class TestIntegration:
     """Integration tests for serialization utilities."""
@@ -229,4 +417,12 @@ class TestIntegration:
         assert deserialized.id == model.id
         assert deserialized.created_at == model.created_at
         assert deserialized.updated_at == model.updated_at
-        assert deserialized.version == model.version 
\ No newline at end of file
+        assert deserialized.version == model.version 
+
+    def test_fast_roundtrip(self):
+        """Test fast_dump and fast_load with a model and a struct."""
+        model = VersionedModel()
+        assert fast_load(VersionedModel, fast_dump(model)) == model
+
+        struct = SampleStruct(name="test")
+        assert fast_load(SampleStruct, fast_dump(struct)) == struct
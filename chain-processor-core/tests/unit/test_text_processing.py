@@ -0,0 +1,64 @@
+"""
+Unit tests for the built-in text processing nodes.
+"""
+
+import pytest
+
+from chain_processor_core.nodes.text_processing import (
+    UppercaseNode,
+    LowercaseNode,
+    ReverseTextNode,
+    remove_whitespace,
+    count_words,
+    count_characters,
+)
+from chain_processor_core.exceptions.errors import InvalidInputError
+
+
+class TestTextProcessingNodes:
+    """Test case for the built-in text processing nodes."""
+
+    def test_transformation_nodes(self):
+        """Test the class-based transformation nodes."""
+        assert UppercaseNode().process("Hello") == "HELLO"
+        assert LowercaseNode().process("Hello") == "hello"
+        assert ReverseTextNode().process("abc") == "cba"
+
+    def test_transformation_nodes_invalid_input(self):
+        """Test that transformation nodes reject invalid input."""
+        for node in (UppercaseNode(), LowercaseNode(), ReverseTextNode()):
+            with pytest.raises(InvalidInputError):
+                node.process("")
+            with pytest.raises(InvalidInputError):
+                node.process(None)
+            with pytest.raises(InvalidInputError):
+                node.process(123)
+
+    def test_transformation_nodes_use_validate_input_override(self):
+        """Test that a subclass's validate_input runs for valid strings too."""
+        for base in (UppercaseNode, LowercaseNode, ReverseTextNode):
+            class StrictNode(base):
+                @classmethod
+                def validate_input(cls, input_text):
+                    super().validate_input(input_text)
+                    if len(input_text) > 3:
+                        raise InvalidInputError("Input too long")
+
+            assert StrictNode().process("abc")
+            with pytest.raises(InvalidInputError):
+                StrictNode().process("abcd")
+
+    def test_remove_whitespace(self):
+        """Test the remove_whitespace function node."""
+        assert remove_whitespace(" a b\tc\n") == "abc"
+
+    def test_count_words(self):
+        """Test the count_words function node."""
+        assert count_words("hello world") == "Word count: 2"
+        assert count_words("  hello \t\n world  again ") == "Word count: 3"
+        assert count_words("   ") == "Word count: 0"
+
+    def test_count_characters(self):
+        """Test the count_characters function node."""
+        assert count_characters("hello") == "Character count: 5"
+        assert count_characters("héllo") == "Character count: 5"
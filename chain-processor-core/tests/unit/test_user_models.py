@@ -0,0 +1,41 @@
+"""
+Unit tests for user models.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from chain_processor_core.models.user import User, UserCreate, UserUpdate
+
+
+class TestUserRoles:
+    """Test case for role validation on user models."""
+
+    def test_default_role(self):
+        """Test that users default to the viewer role."""
+        user = User(username="testuser", email="test@example.com")
+        assert user.roles == ["viewer"]
+
+    def test_valid_roles(self):
+        """Test that known roles are accepted."""
+        user = User(username="testuser", email="test@example.com", roles=["admin", "editor"])
+        assert user.roles == ["admin", "editor"]
+
+    def test_invalid_roles(self):
+        """Test that unknown roles are rejected."""
+        with pytest.raises(ValidationError):
+            User(username="testuser", email="test@example.com", roles=["admin", "root"])
+        with pytest.raises(ValidationError):
+            UserCreate(
+                username="testuser",
+                email="test@example.com",
+                password="Secretpass1",
+                roles=["superuser"],
+            )
+
+    def test_update_roles_optional(self):
+        """Test that UserUpdate accepts missing roles but validates provided ones."""
+        assert UserUpdate().roles is None
+        assert UserUpdate(roles=["viewer"]).roles == ["viewer"]
+        with pytest.raises(ValidationError):
+            UserUpdate(roles=["nobody"])
@@ -29,6 +29,15 @@ class TestValidation:
         # Invalid UUID
         with pytest.raises(InvalidInputError):
             validate_uuid("not-a-uuid")
+        with pytest.raises(InvalidInputError):
+            validate_uuid(None)
+        with pytest.raises(InvalidInputError):
+            validate_uuid(["unhashable"])
+        with pytest.raises(InvalidInputError):
+            validate_uuid("123e4567e89b12d3a456426614174000")
+
+        # Repeated values are served from the parse cache
+        assert validate_uuid(valid_uuid) is validate_uuid(valid_uuid)
 
     def test_validate_text(self):
         """Test text validation."""
@@ -0,0 +1,65 @@
+"""Composite and partial indexes on executions
+
+Revision ID: 002_execution_indexes
+Revises: 001_initial
+Create Date: 2026-10-15
+
+Replaces the single-column ix_chain_executions_strategy_id and
+ix_node_executions_execution_id indexes: the new composite indexes lead with
+the same columns, so they serve every lookup the old ones did and also return
+rows in started_at order without a sort. The partial indexes cover only the
+pending and in-progress rows, a small fraction of either table.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "002_execution_indexes"
+down_revision = "001_initial"
+branch_labels = None
+depends_on = None
+
+ACTIVE_STATUSES = sa.text("status IN ('pending', 'in_progress')")
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_chain_executions_strategy_id"), table_name="chain_executions")
+    op.drop_index(op.f("ix_node_executions_execution_id"), table_name="node_executions")
+
+    op.create_index(
+        "ix_chain_executions_strategy_started",
+        "chain_executions",
+        ["strategy_id", sa.text("started_at DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_node_executions_exec_started",
+        "node_executions",
+        ["execution_id", "started_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_chain_executions_status_active",
+        "chain_executions",
+        ["strategy_id"],
+        unique=False,
+        postgresql_where=ACTIVE_STATUSES,
+    )
+    op.create_index(
+        "ix_node_executions_status_active",
+        "node_executions",
+        ["execution_id"],
+        unique=False,
+        postgresql_where=ACTIVE_STATUSES,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_node_executions_status_active", table_name="node_executions")
+    op.drop_index("ix_chain_executions_status_active", table_name="chain_executions")
+    op.drop_index("ix_node_executions_exec_started", table_name="node_executions")
+    op.drop_index("ix_chain_executions_strategy_started", table_name="chain_executions")
+
+    op.create_index(op.f("ix_node_executions_execution_id"), "node_executions", ["execution_id"], unique=False)
+    op.create_index(op.f("ix_chain_executions_strategy_id"), "chain_executions", ["strategy_id"], unique=False)
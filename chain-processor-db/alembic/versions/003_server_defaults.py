@@ -0,0 +1,62 @@
+"""Server-side defaults for ids and empty JSONB/array columns
+
+Revision ID: 003_server_defaults
+Revises: 002_execution_indexes
+Create Date: 2026-10-15
+
+The initial migration set default= on these columns, which never reaches the
+DDL. Primary keys now default to gen_random_uuid() and the JSONB and array
+columns to empty values, so inserts need not send them.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "003_server_defaults"
+down_revision = "002_execution_indexes"
+branch_labels = None
+depends_on = None
+
+TABLES = (
+    "users",
+    "nodes",
+    "chain_strategies",
+    "strategy_nodes",
+    "chain_executions",
+    "node_executions",
+)
+
+EMPTY_JSONB = sa.text("'{}'::jsonb")
+EMPTY_ARRAY = sa.text("ARRAY[]::varchar[]")
+
+# (table, column, default) for the empty JSONB and array columns
+CONTAINER_DEFAULTS = (
+    ("users", "roles", EMPTY_ARRAY),
+    ("users", "preferences", EMPTY_JSONB),
+    ("nodes", "metadata", EMPTY_JSONB),
+    ("nodes", "tags", EMPTY_ARRAY),
+    ("chain_strategies", "tags", EMPTY_ARRAY),
+    ("chain_strategies", "metadata", EMPTY_JSONB),
+    ("strategy_nodes", "config", EMPTY_JSONB),
+    ("chain_executions", "metadata", EMPTY_JSONB),
+    ("node_executions", "metadata", EMPTY_JSONB),
+)
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it before that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+    for table, column, default in CONTAINER_DEFAULTS:
+        op.alter_column(table, column, server_default=default)
+
+
+def downgrade() -> None:
+    for table, column, _ in CONTAINER_DEFAULTS:
+        op.alter_column(table, column, server_default=None)
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=None)
+    # pgcrypto stays installed, as other objects in the database may use it
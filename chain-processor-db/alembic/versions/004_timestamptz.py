@@ -0,0 +1,57 @@
+"""Store timestamps as timestamptz with now() server defaults
+
+Revision ID: 004_timestamptz
+Revises: 003_server_defaults
+Create Date: 2026-10-15
+
+Existing values were written by datetime.utcnow, so they are read as UTC
+when converted. Indexes on these columns are rebuilt by the type change.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "004_timestamptz"
+down_revision = "003_server_defaults"
+branch_labels = None
+depends_on = None
+
+# Timestamp columns per table, and those of them that default to now()
+TIMESTAMP_COLUMNS = {
+    "users": ("last_login", "created_at", "updated_at"),
+    "nodes": ("created_at", "updated_at"),
+    "chain_strategies": ("created_at", "updated_at"),
+    "strategy_nodes": ("created_at", "updated_at"),
+    "chain_executions": ("started_at", "completed_at", "created_at", "updated_at"),
+    "node_executions": ("started_at", "completed_at", "created_at", "updated_at"),
+}
+NOW_DEFAULT_COLUMNS = ("started_at", "created_at", "updated_at")
+
+
+def upgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                existing_type=sa.DateTime(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+            if column in NOW_DEFAULT_COLUMNS:
+                op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            if column in NOW_DEFAULT_COLUMNS:
+                op.alter_column(table, column, server_default=None)
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                existing_type=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
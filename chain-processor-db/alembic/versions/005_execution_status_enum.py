@@ -0,0 +1,82 @@
+"""Native execution_status enum for execution status columns
+
+Revision ID: 005_execution_status_enum
+Revises: 004_timestamptz
+Create Date: 2026-10-15
+
+Converts chain_executions.status and node_executions.status from
+varchar(20) to a native enum. The partial indexes filtering on status are
+recreated around the type change so their predicates compare enum values.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "005_execution_status_enum"
+down_revision = "004_timestamptz"
+branch_labels = None
+depends_on = None
+
+status_enum = postgresql.ENUM(
+    "pending", "in_progress", "success", "failed", "cancelled",
+    name="execution_status",
+    create_type=False,
+)
+
+TABLES = ("chain_executions", "node_executions")
+
+# Partial indexes over active rows: (name, table, indexed column)
+ACTIVE_INDEXES = (
+    ("ix_chain_executions_status_active", "chain_executions", "strategy_id"),
+    ("ix_node_executions_status_active", "node_executions", "execution_id"),
+)
+
+
+def _drop_active_indexes() -> None:
+    for name, table, _ in ACTIVE_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def _create_active_indexes() -> None:
+    for name, table, column in ACTIVE_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_where=sa.text("status IN ('pending', 'in_progress')"),
+        )
+
+
+def upgrade() -> None:
+    status_enum.create(op.get_bind(), checkfirst=True)
+    _drop_active_indexes()
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "status",
+            type_=status_enum,
+            existing_type=sa.String(20),
+            existing_nullable=False,
+            postgresql_using="status::execution_status",
+        )
+        op.alter_column(table, "status", server_default="pending")
+    _create_active_indexes()
+
+
+def downgrade() -> None:
+    _drop_active_indexes()
+    for table in TABLES:
+        op.alter_column(table, "status", server_default=None)
+        op.alter_column(
+            table,
+            "status",
+            type_=sa.String(20),
+            existing_type=status_enum,
+            existing_nullable=False,
+            postgresql_using="status::text",
+        )
+    _create_active_indexes()
+    status_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,71 @@
+"""Strategy nodes position index and trigger-maintained node_count
+
+Revision ID: 006_strategy_node_count
+Revises: 005_execution_status_enum
+Create Date: 2026-10-15
+
+Replaces ix_strategy_nodes_strategy_id with a (strategy_id, position) index,
+which leads with the same column and also returns a strategy's nodes in
+position order without a sort. Adds chain_strategies.node_count, backfilled
+from the existing links and kept in step by a trigger on strategy_nodes.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "006_strategy_node_count"
+down_revision = "005_execution_status_enum"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_strategy_nodes_strategy_id"), table_name="strategy_nodes")
+    op.create_index(
+        "ix_strategy_nodes_strategy_position", "strategy_nodes", ["strategy_id", "position"], unique=False
+    )
+
+    op.add_column(
+        "chain_strategies",
+        sa.Column("node_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE chain_strategies SET node_count = counts.node_count
+        FROM (
+            SELECT strategy_id, count(*) AS node_count FROM strategy_nodes GROUP BY strategy_id
+        ) AS counts
+        WHERE chain_strategies.id = counts.strategy_id
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION update_strategy_node_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE chain_strategies SET node_count = node_count + 1 WHERE id = NEW.strategy_id;
+                RETURN NEW;
+            END IF;
+            UPDATE chain_strategies SET node_count = node_count - 1 WHERE id = OLD.strategy_id;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_strategy_nodes_node_count
+        AFTER INSERT OR DELETE ON strategy_nodes
+        FOR EACH ROW EXECUTE FUNCTION update_strategy_node_count()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_strategy_nodes_node_count ON strategy_nodes")
+    op.execute("DROP FUNCTION IF EXISTS update_strategy_node_count()")
+    op.drop_column("chain_strategies", "node_count")
+
+    op.drop_index("ix_strategy_nodes_strategy_position", table_name="strategy_nodes")
+    op.create_index(op.f("ix_strategy_nodes_strategy_id"), "strategy_nodes", ["strategy_id"], unique=False)
@@ -0,0 +1,29 @@
+"""GIN indexes on the tags and roles arrays
+
+Revision ID: 007_array_gin_indexes
+Revises: 006_strategy_node_count
+Create Date: 2026-10-15
+
+Serve the @> containment lookups behind get_by_tag and get_by_role.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "007_array_gin_indexes"
+down_revision = "006_strategy_node_count"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_nodes_tags_gin", "nodes", ["tags"], postgresql_using="gin")
+    op.create_index("ix_chain_strategies_tags_gin", "chain_strategies", ["tags"], postgresql_using="gin")
+    op.create_index("ix_users_roles_gin", "users", ["roles"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_roles_gin", table_name="users")
+    op.drop_index("ix_chain_strategies_tags_gin", table_name="chain_strategies")
+    op.drop_index("ix_nodes_tags_gin", table_name="nodes")
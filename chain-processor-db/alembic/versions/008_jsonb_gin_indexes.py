@@ -0,0 +1,33 @@
+"""GIN jsonb_path_ops indexes on node metadata and user preferences
+
+Revision ID: 008_jsonb_gin_indexes
+Revises: 007_array_gin_indexes
+Create Date: 2026-10-15
+
+jsonb_path_ops only supports @>, but is smaller and faster than jsonb_ops.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "008_jsonb_gin_indexes"
+down_revision = "007_array_gin_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_nodes_metadata_gin", "nodes", ["metadata"],
+        postgresql_using="gin", postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_users_preferences_gin", "users", ["preferences"],
+        postgresql_using="gin", postgresql_ops={"preferences": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_preferences_gin", table_name="users")
+    op.drop_index("ix_nodes_metadata_gin", table_name="nodes")
@@ -0,0 +1,62 @@
+"""Indexes matching the execution listings and active nodes
+
+Revision ID: 009_execution_listing_indexes
+Revises: 008_jsonb_gin_indexes
+Create Date: 2026-10-15
+
+The repository's "WHERE x = ? ORDER BY created_at DESC LIMIT n" reads become
+backward index range scans with no sort step. Replaces the single-column
+ix_chain_executions_status index: (status, created_at) leads with the same
+column and serves every lookup it did. Also adds a partial index over active
+nodes for get_active_nodes.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "009_execution_listing_indexes"
+down_revision = "008_jsonb_gin_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_chain_executions_status"), table_name="chain_executions")
+
+    op.create_index(
+        "ix_chain_executions_status_created",
+        "chain_executions",
+        ["status", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_chain_executions_strategy_created",
+        "chain_executions",
+        ["strategy_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_chain_executions_creator_created",
+        "chain_executions",
+        ["created_by_id", "created_at"],
+        unique=False,
+    )
+    op.create_index("ix_chain_executions_created_at", "chain_executions", ["created_at"], unique=False)
+    op.create_index(
+        "ix_nodes_active",
+        "nodes",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_nodes_active", table_name="nodes")
+    op.drop_index("ix_chain_executions_created_at", table_name="chain_executions")
+    op.drop_index("ix_chain_executions_creator_created", table_name="chain_executions")
+    op.drop_index("ix_chain_executions_strategy_created", table_name="chain_executions")
+    op.drop_index("ix_chain_executions_status_created", table_name="chain_executions")
+
+    op.create_index(op.f("ix_chain_executions_status"), "chain_executions", ["status"], unique=False)
@@ -0,0 +1,30 @@
+"""Unique (strategy_id, node_id, position) on strategy_nodes
+
+Revision ID: 010_strategy_nodes_unique
+Revises: 009_execution_listing_indexes
+Create Date: 2026-10-15
+
+Conflict target for the idempotent add_node_to_strategy insert. The upgrade
+fails if duplicate links already exist; remove them first.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "010_strategy_nodes_unique"
+down_revision = "009_execution_listing_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        "uq_strategy_nodes_strategy_node_position",
+        "strategy_nodes",
+        ["strategy_id", "node_id", "position"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_strategy_nodes_strategy_node_position", "strategy_nodes", type_="unique")
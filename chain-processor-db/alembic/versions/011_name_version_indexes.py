@@ -0,0 +1,37 @@
+"""(name, version DESC) indexes on nodes and chain strategies
+
+Revision ID: 011_name_version_indexes
+Revises: 010_strategy_nodes_unique
+Create Date: 2026-10-15
+
+get_latest_version's "WHERE name = ? ORDER BY version DESC LIMIT 1" becomes
+a single index seek. Replaces ix_nodes_name and ix_chain_strategies_name:
+the new indexes lead with name and serve every lookup the old ones did.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "011_name_version_indexes"
+down_revision = "010_strategy_nodes_unique"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_nodes_name"), table_name="nodes")
+    op.drop_index(op.f("ix_chain_strategies_name"), table_name="chain_strategies")
+
+    op.create_index("ix_nodes_name_version", "nodes", ["name", sa.text("version DESC")], unique=False)
+    op.create_index(
+        "ix_chain_strategies_name_version", "chain_strategies", ["name", sa.text("version DESC")], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chain_strategies_name_version", table_name="chain_strategies")
+    op.drop_index("ix_nodes_name_version", table_name="nodes")
+
+    op.create_index(op.f("ix_chain_strategies_name"), "chain_strategies", ["name"], unique=False)
+    op.create_index(op.f("ix_nodes_name"), "nodes", ["name"], unique=False)
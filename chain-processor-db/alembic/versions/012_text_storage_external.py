@@ -0,0 +1,36 @@
+"""Store large node and execution text uncompressed and out of line
+
+Revision ID: 012_text_storage_external
+Revises: 011_name_version_indexes
+Create Date: 2026-10-15
+
+Row scans skip the text, and reading it back needs no decompression. Only
+values written after the upgrade are affected; existing rows keep their
+current storage until rewritten.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "012_text_storage_external"
+down_revision = "011_name_version_indexes"
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    ("nodes", "code"),
+    ("node_executions", "input_text"),
+    ("node_executions", "output_text"),
+)
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    # EXTENDED is PostgreSQL's default for text columns
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTENDED")
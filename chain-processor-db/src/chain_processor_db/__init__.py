@@ -5,6 +5,14 @@ This package contains database models, migrations, and data access layers
 for the Chain Processing System.
 """
 
-from importlib import metadata
+from typing import Any
 
-__version__ = metadata.version("chain-processor-db") 
\ No newline at end of file
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__`` on first access rather than at import time."""
+    if name == "__version__":
+        from importlib import metadata
+
+        version = globals()["__version__"] = metadata.version("chain-processor-db")
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,7 +9,7 @@ from datetime import datetime
 import uuid
 from typing import Any, ClassVar, Dict, Optional
 
-from sqlalchemy import MetaData, UUID, func
+from sqlalchemy import DateTime, MetaData, UUID, func, text
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -25,6 +25,11 @@ convention = {
     "pk": "pk_%(table_name)s",
 }
 
+# Server-side defaults, so inserts need not send empty containers or new IDs
+EMPTY_JSONB = text("'{}'::jsonb")
+EMPTY_ARRAY = text("ARRAY[]::varchar[]")
+GEN_UUID = text("gen_random_uuid()")
+
 # Create metadata with naming conventions
 chain_db_metadata = MetaData(naming_convention=convention)
 
@@ -38,6 +43,7 @@ class Base(DeclarativeBase):
     metadata = chain_db_metadata # Explicitly associate metadata
     type_annotation_map: ClassVar[Dict[Any, Any]] = {
         uuid.UUID: UUID(as_uuid=True),
+        datetime: DateTime(timezone=True),
     }
 
 
@@ -45,10 +51,10 @@ class TimestampMixin:
     """Mixin to add created_at and updated_at columns to models."""
 
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow, nullable=False
+        server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
     )
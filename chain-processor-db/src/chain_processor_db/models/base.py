@@ -9,7 +9,7 @@ from sqlalchemy import Column, Integer, DateTime, func, String, UUID
 from sqlalchemy.orm import declared_attr
 from sqlalchemy.orm import Mapped, mapped_column
 
-from ..base import Base, TimestampMixin, VersionedMixin
+from ..base import GEN_UUID, Base, TimestampMixin, VersionedMixin
 
 
 class BaseModel(Base, TimestampMixin):
@@ -18,7 +18,7 @@ class BaseModel(Base, TimestampMixin):
     __abstract__ = True
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, server_default=GEN_UUID
     )
 
     @declared_attr
@@ -7,10 +7,11 @@ This module defines the database models for chains and strategies.
 import uuid
 from typing import Dict, List, Optional
 
-from sqlalchemy import String, Text, ForeignKey, Boolean, Integer
+from sqlalchemy import DDL, Index, String, Text, ForeignKey, Boolean, Integer, UniqueConstraint, event, text
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from ..base import EMPTY_ARRAY, EMPTY_JSONB
 from .base import BaseModel, BaseVersionedModel
 
 
@@ -18,6 +19,12 @@ class ChainStrategy(BaseVersionedModel):
     """Chain strategy model for the Chain Processing System."""
 
     __tablename__ = "chain_strategies"
+    __table_args__ = (
+        # GIN index for @> containment lookups on tags
+        Index("ix_chain_strategies_tags_gin", "tags", postgresql_using="gin"),
+        # Serves name lookups and get_latest_version's ORDER BY version DESC LIMIT 1
+        Index("ix_chain_strategies_name_version", "name", text("version DESC")),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -25,17 +32,19 @@ class ChainStrategy(BaseVersionedModel):
         ForeignKey("users.id"), nullable=True
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    tags: Mapped[List[str]] = mapped_column(ARRAY(String), default=list, nullable=False)
+    tags: Mapped[List[str]] = mapped_column(ARRAY(String), server_default=EMPTY_ARRAY, nullable=False)
     metadata_json: Mapped[Dict] = mapped_column(
-        "metadata", JSONB, default=dict, nullable=False
+        "metadata", JSONB, server_default=EMPTY_JSONB, nullable=False
     )
+    # Maintained by a trigger on strategy_nodes (PostgreSQL only)
+    node_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
 
     # Relationships
     created_by_user = relationship("User", back_populates="chain_strategies")
     strategy_nodes = relationship(
         "StrategyNode", 
         back_populates="strategy", 
-        order_by="StrategyNode.position"
+        order_by="StrategyNode.position",
     )
     chain_executions = relationship("ChainExecution", back_populates="strategy")
 
@@ -48,15 +57,24 @@ class StrategyNode(BaseModel):
     """Link model between strategies and nodes."""
 
     __tablename__ = "strategy_nodes"
+    __table_args__ = (
+        # Conflict target for idempotent add_node_to_strategy
+        UniqueConstraint(
+            "strategy_id", "node_id", "position",
+            name="uq_strategy_nodes_strategy_node_position",
+        ),
+        # Serves the strategy_nodes relationship's ORDER BY position
+        Index("ix_strategy_nodes_strategy_position", "strategy_id", "position"),
+    )
 
     strategy_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("chain_strategies.id"), nullable=False
     )
     node_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("nodes.id"), nullable=False
+        ForeignKey("nodes.id"), nullable=False, index=True
     )
     position: Mapped[int] = mapped_column(Integer, nullable=False)
-    config: Mapped[Dict] = mapped_column(JSONB, default=dict, nullable=False)
+    config: Mapped[Dict] = mapped_column(JSONB, server_default=EMPTY_JSONB, nullable=False)
 
     # Relationships
     strategy = relationship("ChainStrategy", back_populates="strategy_nodes")
@@ -64,4 +82,38 @@ class StrategyNode(BaseModel):
 
     def __repr__(self) -> str:
         """Return string representation of the StrategyNode model."""
-        return f"<StrategyNode {self.strategy_id}:{self.node_id} pos:{self.position}>" 
\ No newline at end of file
+        return f"<StrategyNode {self.strategy_id}:{self.node_id} pos:{self.position}>"
+
+
+# Keep ChainStrategy.node_count in step with its strategy_nodes rows
+_node_count_function = DDL("""
+CREATE OR REPLACE FUNCTION update_strategy_node_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE chain_strategies SET node_count = node_count + 1 WHERE id = NEW.strategy_id;
+        RETURN NEW;
+    END IF;
+    UPDATE chain_strategies SET node_count = node_count - 1 WHERE id = OLD.strategy_id;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql
+""")
+_node_count_trigger = DDL("""
+CREATE TRIGGER trg_strategy_nodes_node_count
+AFTER INSERT OR DELETE ON strategy_nodes
+FOR EACH ROW EXECUTE FUNCTION update_strategy_node_count()
+""")
+_drop_node_count_function = DDL("DROP FUNCTION IF EXISTS update_strategy_node_count()")
+
+event.listen(
+    StrategyNode.__table__, "after_create",
+    _node_count_function.execute_if(dialect="postgresql"),
+)
+event.listen(
+    StrategyNode.__table__, "after_create",
+    _node_count_trigger.execute_if(dialect="postgresql"),
+)
+event.listen(
+    StrategyNode.__table__, "after_drop",
+    _drop_node_count_function.execute_if(dialect="postgresql"),
+)
@@ -5,17 +5,19 @@ This module defines the database models for tracking executions of chains and no
 """
 
 from datetime import datetime
+import enum
 import uuid
 from typing import Dict, Optional, List, Literal
 
-from sqlalchemy import String, Text, ForeignKey, Integer, Enum
+from sqlalchemy import DDL, Index, Text, ForeignKey, Integer, Enum, event, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from ..base import EMPTY_JSONB
 from .base import BaseModel, BaseVersionedModel
 
 
-class ExecutionStatus(str, Enum):
+class ExecutionStatus(str, enum.Enum):
     """Execution status enum."""
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -24,10 +26,33 @@ class ExecutionStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Native "execution_status" enum on PostgreSQL, storing the lowercase values
+execution_status = Enum(
+    ExecutionStatus,
+    name="execution_status",
+    values_callable=lambda statuses: [status.value for status in statuses],
+)
+
+# Predicate of the partial indexes over executions that are still running
+ACTIVE_STATUSES = text("status IN ('pending', 'in_progress')")
+
+
 class ChainExecution(BaseVersionedModel):
     """Chain execution record model."""
 
     __tablename__ = "chain_executions"
+    __table_args__ = (
+        # Equality column first, sort column last: the repository's
+        # "WHERE x = ? ORDER BY created_at DESC LIMIT n" reads become
+        # backward index range scans with no sort step
+        Index("ix_chain_executions_status_created", "status", "created_at"),
+        Index("ix_chain_executions_strategy_created", "strategy_id", "created_at"),
+        Index("ix_chain_executions_creator_created", "created_by_id", "created_at"),
+        Index("ix_chain_executions_created_at", "created_at"),
+        # A strategy's executions newest first, and its still-running ones
+        Index("ix_chain_executions_strategy_started", "strategy_id", text("started_at DESC")),
+        Index("ix_chain_executions_status_active", "strategy_id", postgresql_where=ACTIVE_STATUSES),
+    )
 
     strategy_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("chain_strategies.id"), nullable=False
@@ -35,19 +60,20 @@ class ChainExecution(BaseVersionedModel):
     input_text: Mapped[str] = mapped_column(Text, nullable=False)
     output_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(
-        String(20),
-        default="pending",
+    status: Mapped[ExecutionStatus] = mapped_column(
+        execution_status,
+        default=ExecutionStatus.PENDING,
+        server_default=ExecutionStatus.PENDING.value,
         nullable=False,
     )
-    started_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
     completed_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     execution_time_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     created_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         ForeignKey("users.id"), nullable=True
     )
     metadata_json: Mapped[Dict] = mapped_column(
-        "metadata", JSONB, default=dict, nullable=False
+        "metadata", JSONB, server_default=EMPTY_JSONB, nullable=False
     )
 
     # Relationships
@@ -68,26 +94,33 @@ class NodeExecution(BaseModel):
     """Node execution record model."""
 
     __tablename__ = "node_executions"
+    __table_args__ = (
+        # An execution's node runs in started_at order, and its still-running ones
+        Index("ix_node_executions_exec_started", "execution_id", "started_at"),
+        Index("ix_node_executions_status_active", "execution_id", postgresql_where=ACTIVE_STATUSES),
+    )
 
     execution_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("chain_executions.id"), nullable=False
     )
     node_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("nodes.id"), nullable=False
+        ForeignKey("nodes.id"), nullable=False, index=True
     )
     input_text: Mapped[str] = mapped_column(Text, nullable=False)
     output_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(
-        String(20),
-        default="pending",
+    status: Mapped[ExecutionStatus] = mapped_column(
+        execution_status,
+        default=ExecutionStatus.PENDING,
+        server_default=ExecutionStatus.PENDING.value,
         nullable=False,
+        index=True,
     )
-    started_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
     completed_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     execution_time_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     metadata_json: Mapped[Dict] = mapped_column(
-        "metadata", JSONB, default=dict, nullable=False
+        "metadata", JSONB, server_default=EMPTY_JSONB, nullable=False
     )
 
     # Relationships
@@ -96,4 +129,15 @@ class NodeExecution(BaseModel):
 
     def __repr__(self) -> str:
         """Return string representation of the NodeExecution model."""
-        return f"<NodeExecution {self.id} node:{self.node_id} status:{self.status}>" 
\ No newline at end of file
+        return f"<NodeExecution {self.id} node:{self.node_id} status:{self.status}>"
+
+
+# Store node input/output text out of line and uncompressed, so row scans don't touch it
+event.listen(
+    NodeExecution.__table__, "after_create",
+    DDL(
+        "ALTER TABLE node_executions"
+        " ALTER COLUMN input_text SET STORAGE EXTERNAL,"
+        " ALTER COLUMN output_text SET STORAGE EXTERNAL"
+    ).execute_if(dialect="postgresql"),
+)
@@ -7,10 +7,11 @@ This module defines the database models for processing nodes.
 import uuid
 from typing import Dict, List, Optional
 
-from sqlalchemy import String, Text, ForeignKey, Boolean
+from sqlalchemy import DDL, Index, String, Text, ForeignKey, Boolean, event, text
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from ..base import EMPTY_ARRAY, EMPTY_JSONB
 from .base import BaseModel, BaseVersionedModel
 
 
@@ -18,6 +19,21 @@ class Node(BaseVersionedModel):
     """Node model for the Chain Processing System."""
 
     __tablename__ = "nodes"
+    __table_args__ = (
+        # GIN index for @> containment lookups on tags
+        Index("ix_nodes_tags_gin", "tags", postgresql_using="gin"),
+        # jsonb_path_ops only supports @>, but is smaller and faster than jsonb_ops
+        Index(
+            "ix_nodes_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        # Serves name lookups and get_latest_version's ORDER BY version DESC LIMIT 1
+        Index("ix_nodes_name_version", "name", text("version DESC")),
+        # Partial index over active nodes only, for get_active_nodes
+        Index("ix_nodes_active", "id", postgresql_where=text("is_active")),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -28,9 +44,9 @@ class Node(BaseVersionedModel):
     is_builtin: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     metadata_json: Mapped[Dict] = mapped_column(
-        "metadata", JSONB, default=dict, nullable=False
+        "metadata", JSONB, server_default=EMPTY_JSONB, nullable=False
     )
-    tags: Mapped[List[str]] = mapped_column(ARRAY(String), default=list, nullable=False)
+    tags: Mapped[List[str]] = mapped_column(ARRAY(String), server_default=EMPTY_ARRAY, nullable=False)
 
     # Relationships
     created_by_user = relationship("User", back_populates="nodes")
@@ -39,4 +55,11 @@ class Node(BaseVersionedModel):
 
     def __repr__(self) -> str:
         """Return string representation of the Node model."""
-        return f"<Node {self.name} v{self.version}>" 
\ No newline at end of file
+        return f"<Node {self.name} v{self.version}>"
+
+
+# Store code out of line and uncompressed, so row scans don't touch it
+event.listen(
+    Node.__table__, "after_create",
+    DDL("ALTER TABLE nodes ALTER COLUMN code SET STORAGE EXTERNAL").execute_if(dialect="postgresql"),
+)
@@ -8,10 +8,11 @@ from datetime import datetime
 import uuid
 from typing import Dict, List, Optional
 
-from sqlalchemy import String, Boolean, Text
+from sqlalchemy import Index, String, Boolean, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from ..base import EMPTY_ARRAY, EMPTY_JSONB
 from .base import BaseModel, BaseVersionedModel
 
 
@@ -19,14 +20,25 @@ class User(BaseVersionedModel):
     """User model for the Chain Processing System."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # GIN index for @> containment lookups on roles
+        Index("ix_users_roles_gin", "roles", postgresql_using="gin"),
+        # jsonb_path_ops only supports @>, but is smaller and faster than jsonb_ops
+        Index(
+            "ix_users_preferences_gin",
+            "preferences",
+            postgresql_using="gin",
+            postgresql_ops={"preferences": "jsonb_path_ops"},
+        ),
+    )
 
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    roles: Mapped[List[str]] = mapped_column(ARRAY(String), default=list, nullable=False)
-    preferences: Mapped[Dict] = mapped_column(JSONB, default=dict, nullable=False)
+    roles: Mapped[List[str]] = mapped_column(ARRAY(String), server_default=EMPTY_ARRAY, nullable=False)
+    preferences: Mapped[Dict] = mapped_column(JSONB, server_default=EMPTY_JSONB, nullable=False)
     last_login: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
     # Relationships
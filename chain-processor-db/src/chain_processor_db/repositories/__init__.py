@@ -5,7 +5,7 @@ This package contains repository classes that provide data access
 to the database models used by the Chain Processing System.
 """
 
-from .base import BaseRepository
+from .base import AsyncBaseRepository, BaseRepository
 from .user_repo import UserRepository
 from .node_repo import NodeRepository
 from .chain_repo import ChainRepository
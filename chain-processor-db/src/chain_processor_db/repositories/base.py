@@ -5,20 +5,94 @@ This module defines the base repository class that provides common
 CRUD operations for all repositories.
 """
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, cast, get_args
+from typing import Any, AsyncIterator, Dict, Generic, Iterator, List, Literal, Optional, Type, TypeVar, cast, get_args
 import uuid
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import ColumnElement, Select, delete, exists as sa_exists, func, insert, lambda_stmt, literal, select, text, update
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ..models.base import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
+M = TypeVar("M", bound=BaseModel)
+
+# Rows per multi-row INSERT; gains flatten out beyond roughly 100
+INSERT_BATCH_SIZE = 100
+
+# Rows fetched per round trip when streaming results
+YIELD_PER = 100
+
+TagMatch = Literal["any", "all"]
+
+
+def array_match(column: Any, values: List[str], mode: TagMatch) -> ColumnElement[bool]:
+    """
+    Build a GIN-indexable predicate matching an ARRAY column against values.
+
+    Args:
+        column: The ARRAY column
+        values: The values to match
+        mode: "any" for overlap (&&), "all" for containment (@>)
+
+    Returns:
+        The predicate
+
+    Raises:
+        ValueError: If the mode is not "any" or "all"
+    """
+    if mode == "any":
+        return cast(ColumnElement[bool], column.overlap(values))
+    if mode == "all":
+        return cast(ColumnElement[bool], column.contains(values))
+    raise ValueError(f"Invalid match mode: {mode!r}")
+
+
+def _resolve_model_class(cls: type) -> None:
+    """
+    Set a repository class's model_class from its generic parameter.
+
+    Runs once per subclass, so instantiating a repository per request stays
+    free of typing introspection. Subclasses of a concrete repository
+    inherit its model_class.
+    """
+    for base in cls.__dict__.get("__orig_bases__", ()):
+        args = get_args(base)
+        if args and isinstance(args[0], type):
+            cls.model_class = args[0]  # type: ignore[attr-defined]
+            return
+
+
+def _explain_sql(stmt: Select[Any], dialect: Dialect) -> Optional[str]:
+    """
+    Render an EXPLAIN for a query with its parameters inline.
+
+    Args:
+        stmt: The query to explain
+        dialect: The dialect to render for
+
+    Returns:
+        The EXPLAIN statement, or None if a parameter has no literal form
+        (e.g. a JSONB value)
+    """
+    try:
+        sql = stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    except CompileError:
+        return None
+    return f"EXPLAIN (FORMAT JSON) {sql}"
 
 
 class BaseRepository(Generic[T]):
     """Base repository class with common CRUD operations."""
 
+    model_class: Type[T]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _resolve_model_class(cls)
+
     def __init__(self, db: Session):
         """
         Initialize a new repository.
@@ -27,9 +101,6 @@ class BaseRepository(Generic[T]):
             db: SQLAlchemy session
         """
         self.db = db
-        # Extract the model type from the generic parameter
-        # This is a bit of a hack but works well for typed repositories
-        self.model_class = cast(Type[T], get_args(self.__class__.__orig_bases__[0])[0])
 
     def get_by_id(self, id: uuid.UUID) -> Optional[T]:
         """
@@ -54,9 +125,32 @@ class BaseRepository(Generic[T]):
         Returns:
             List of entities
         """
-        stmt = select(self.model_class).limit(limit).offset(offset)
+        # Short reads are lambda statements: SQLAlchemy caches the built and
+        # compiled statement and only re-binds the closure values per call
+        model_class = self.model_class
+        stmt = lambda_stmt(
+            lambda: select(model_class).limit(limit).offset(offset),
+            track_on=[model_class],
+        )
         return list(self.db.scalars(stmt).all())
 
+    def iter_all(self, batch_size: int = YIELD_PER) -> Iterator[T]:
+        """
+        Stream all entities without loading them into memory at once.
+
+        Rows are fetched through a server-side cursor ``batch_size`` at a
+        time, so memory stays flat however large the table is. Use this for
+        batch consumers such as reports; ``get_all`` remains for pages.
+
+        Args:
+            batch_size: Number of rows to fetch per round trip
+
+        Yields:
+            Each entity in turn
+        """
+        stmt = select(self.model_class).execution_options(yield_per=batch_size)
+        yield from self.db.scalars(stmt)
+
     def create(self, entity: T) -> T:
         """
         Create a new entity.
@@ -89,10 +183,9 @@ class BaseRepository(Generic[T]):
             .values(**data)
             .returning(self.model_class)
         )
-        result = self.db.execute(stmt)
+        # Read RETURNING before committing; not every driver buffers it
+        updated_entity = self.db.execute(stmt).scalar_one_or_none()
         self.db.commit()
-        
-        updated_entity = result.scalar_one_or_none()
         return updated_entity
 
     def delete(self, id: uuid.UUID) -> bool:
@@ -122,6 +215,215 @@ class BaseRepository(Generic[T]):
         Returns:
             True if the entity exists, False otherwise
         """
-        stmt = select(self.model_class).where(self.model_class.id == id).exists()
-        result = self.db.execute(select(stmt))
-        return result.scalar_one() 
\ No newline at end of file
+        # SELECT true WHERE EXISTS (...) projects no columns and stops at the PK probe
+        stmt = select(literal(True)).where(sa_exists().where(self.model_class.id == id))
+        return bool(self.db.scalar(stmt))
+
+    def approx_count(self) -> int:
+        """
+        Estimate the number of rows in the table from planner statistics.
+
+        Reads ``pg_class.reltuples`` instead of scanning the table; the
+        figure is as fresh as the last VACUUM/ANALYZE. Falls back to an
+        exact count on tables that have never been analyzed and on
+        databases other than PostgreSQL.
+
+        Returns:
+            The estimated row count
+        """
+        count_all = select(self.model_class)
+        if self.db.get_bind().dialect.name != "postgresql":
+            return self._exact_count(count_all)
+        estimate = self.db.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": self.model_class.__tablename__},
+        )
+        if estimate is None or estimate < 0:
+            return self._exact_count(count_all)
+        return int(estimate)
+
+    def _estimate_count(self, stmt: Select[Any]) -> int:
+        """
+        Estimate the number of rows a query returns from its query plan.
+
+        Falls back to an exact count on databases other than PostgreSQL and
+        when the query's parameters cannot be rendered inline.
+
+        Args:
+            stmt: The query to estimate, built from trusted values only since
+                they are rendered inline into the EXPLAIN
+
+        Returns:
+            The planner's row estimate
+        """
+        dialect = self.db.get_bind().dialect
+        sql = _explain_sql(stmt, dialect) if dialect.name == "postgresql" else None
+        if sql is None:
+            return self._exact_count(stmt)
+        # Sent as-is so literals containing ":" aren't taken for bind params
+        plan = self.db.connection().exec_driver_sql(sql).scalar_one()
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _exact_count(self, stmt: Select[Any]) -> int:
+        """
+        Count the rows a query returns.
+
+        Args:
+            stmt: The query to count
+
+        Returns:
+            The number of rows
+        """
+        return self.db.scalar(select(func.count()).select_from(stmt.subquery())) or 0
+
+    def _insert_many(self, model_class: Type[M], rows: List[Dict[str, Any]]) -> List[M]:
+        """
+        Insert rows in multi-row batches.
+
+        The rows are not committed, so the caller controls the transaction
+        and can commit the batch together with related changes.
+
+        Args:
+            model_class: The model to insert into
+            rows: The column values for each row
+
+        Returns:
+            The inserted entities, populated from RETURNING
+        """
+        stmt = insert(model_class).returning(model_class)
+        entities: List[M] = []
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            entities.extend(self.db.scalars(stmt, rows[start:start + INSERT_BATCH_SIZE]))
+        return entities
+
+
+class AsyncBaseRepository(Generic[T]):
+    """
+    Async counterpart of ``BaseRepository`` for use with an ``AsyncSession``.
+
+    Each call awaits the database instead of blocking the event loop, so
+    async routes can run many queries concurrently over the shared pool.
+    """
+
+    model_class: Type[T]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _resolve_model_class(cls)
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize a new async repository.
+
+        Args:
+            db: SQLAlchemy async session
+        """
+        self.db = db
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[T]:
+        """
+        Get an entity by ID.
+
+        Args:
+            id: The entity ID
+
+        Returns:
+            The entity if found, None otherwise
+        """
+        return await self.db.get(self.model_class, id)
+
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[T]:
+        """
+        Get all entities with pagination.
+
+        Args:
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            List of entities
+        """
+        model_class = self.model_class
+        stmt = lambda_stmt(
+            lambda: select(model_class).limit(limit).offset(offset),
+            track_on=[model_class],
+        )
+        return list((await self.db.scalars(stmt)).all())
+
+    async def iter_all(self, batch_size: int = YIELD_PER) -> AsyncIterator[T]:
+        """
+        Stream all entities without loading them into memory at once.
+
+        Args:
+            batch_size: Number of rows to fetch per round trip
+
+        Yields:
+            Each entity in turn
+        """
+        stmt = select(self.model_class).execution_options(yield_per=batch_size)
+        async for entity in await self.db.stream_scalars(stmt):
+            yield entity
+
+    async def create(self, entity: T) -> T:
+        """
+        Create a new entity.
+
+        Args:
+            entity: The entity to create
+
+        Returns:
+            The created entity with updated ID and timestamps
+        """
+        self.db.add(entity)
+        await self.db.commit()
+        await self.db.refresh(entity)
+        return entity
+
+    async def update(self, id: uuid.UUID, data: Dict[str, Any]) -> Optional[T]:
+        """
+        Update an entity by ID.
+
+        Args:
+            id: The entity ID
+            data: The fields to update
+
+        Returns:
+            The updated entity if found, None otherwise
+        """
+        stmt = (
+            update(self.model_class)
+            .where(self.model_class.id == id)
+            .values(**data)
+            .returning(self.model_class)
+        )
+        updated_entity = (await self.db.execute(stmt)).scalar_one_or_none()
+        await self.db.commit()
+        return updated_entity
+
+    async def delete(self, id: uuid.UUID) -> bool:
+        """
+        Delete an entity by ID.
+
+        Args:
+            id: The entity ID
+
+        Returns:
+            True if the entity was deleted, False if it was not found
+        """
+        stmt = delete(self.model_class).where(self.model_class.id == id)
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount > 0
+
+    async def exists(self, id: uuid.UUID) -> bool:
+        """
+        Check if an entity with the given ID exists.
+
+        Args:
+            id: The entity ID
+
+        Returns:
+            True if the entity exists, False otherwise
+        """
+        stmt = select(literal(True)).where(sa_exists().where(self.model_class.id == id))
+        return bool(await self.db.scalar(stmt))
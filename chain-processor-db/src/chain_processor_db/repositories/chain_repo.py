@@ -4,19 +4,27 @@ Chain repository for the Chain Processing System.
 This module defines the repository for chain-related operations.
 """
 
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, func, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
 
 from ..models.chain import ChainStrategy, StrategyNode
 from ..models.node import Node
-from .base import BaseRepository
+from .base import BaseRepository, TagMatch, array_match
 
 
 class ChainRepository(BaseRepository[ChainStrategy]):
-    """Repository for ChainStrategy entities."""
+    """
+    Repository for ChainStrategy entities.
+
+    The inherited create, update and delete methods commit. The methods
+    that edit a strategy's node links (``add_node_to_strategy``,
+    ``add_nodes_to_strategy`` and ``remove_node_from_strategy``) do not,
+    so callers can make several edits in one transaction and commit once.
+    """
 
     def get_by_name(self, name: str) -> Optional[ChainStrategy]:
         """
@@ -28,7 +36,7 @@ class ChainRepository(BaseRepository[ChainStrategy]):
         Returns:
             The chain strategy if found, None otherwise
         """
-        stmt = select(ChainStrategy).where(ChainStrategy.name == name)
+        stmt = lambda_stmt(lambda: select(ChainStrategy).where(ChainStrategy.name == name))
         return self.db.scalar(stmt)
 
     def get_by_tag(self, tag: str, limit: int = 100, offset: int = 0) -> List[ChainStrategy]:
@@ -43,9 +51,40 @@ class ChainRepository(BaseRepository[ChainStrategy]):
         Returns:
             List of chain strategies with the specified tag
         """
-        stmt = select(ChainStrategy).where(
-            ChainStrategy.tags.contains([tag])
-        ).limit(limit).offset(offset)
+        tags = [tag]
+        stmt = lambda_stmt(
+            lambda: select(ChainStrategy)
+            .where(ChainStrategy.tags.contains(tags))
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(self.db.scalars(stmt).all())
+
+    def get_by_tags(
+        self, tags: List[str], mode: TagMatch = "any", limit: int = 100, offset: int = 0
+    ) -> List[ChainStrategy]:
+        """
+        Get chain strategies matching several tags in one query.
+
+        Args:
+            tags: The tags to filter by
+            mode: "any" to match chain strategies with at least one of the tags,
+                "all" to match chain strategies with every tag
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            List of matching chain strategies
+
+        Raises:
+            ValueError: If the mode is not "any" or "all"
+        """
+        stmt = (
+            select(ChainStrategy)
+            .where(array_match(ChainStrategy.tags, tags, mode))
+            .limit(limit)
+            .offset(offset)
+        )
         return list(self.db.scalars(stmt).all())
 
     def get_with_nodes(self, strategy_id: uuid.UUID) -> Optional[ChainStrategy]:
@@ -60,7 +99,7 @@ class ChainRepository(BaseRepository[ChainStrategy]):
         """
         stmt = (
             select(ChainStrategy)
-            .options(joinedload(ChainStrategy.strategy_nodes).joinedload(StrategyNode.node))
+            .options(selectinload(ChainStrategy.strategy_nodes).selectinload(StrategyNode.node))
             .where(ChainStrategy.id == strategy_id)
         )
         return self.db.scalar(stmt)
@@ -76,9 +115,12 @@ class ChainRepository(BaseRepository[ChainStrategy]):
         Returns:
             List of active chain strategies
         """
-        stmt = select(ChainStrategy).where(
-            ChainStrategy.is_active == True
-        ).limit(limit).offset(offset)
+        stmt = lambda_stmt(
+            lambda: select(ChainStrategy)
+            .where(ChainStrategy.is_active == True)
+            .limit(limit)
+            .offset(offset)
+        )
         return list(self.db.scalars(stmt).all())
 
     def get_latest_version(self, name: str) -> Optional[ChainStrategy]:
@@ -91,8 +133,8 @@ class ChainRepository(BaseRepository[ChainStrategy]):
         Returns:
             The latest version of the chain strategy if found, None otherwise
         """
-        stmt = (
-            select(ChainStrategy)
+        stmt = lambda_stmt(
+            lambda: select(ChainStrategy)
             .where(ChainStrategy.name == name)
             .order_by(ChainStrategy.version.desc())
             .limit(1)
@@ -103,23 +145,45 @@ class ChainRepository(BaseRepository[ChainStrategy]):
         """
         Count the number of chain strategies created by a user.
 
+        This is an exact count; prefer ``approx_count_by_creator`` for
+        dashboards.
+
         Args:
             creator_id: The ID of the creator
 
         Returns:
             The number of chain strategies created by the user
         """
-        stmt = select(func.count()).select_from(
-            ChainStrategy
-        ).where(ChainStrategy.created_by_id == creator_id)
+        stmt = lambda_stmt(
+            lambda: select(func.count())
+            .select_from(ChainStrategy)
+            .where(ChainStrategy.created_by_id == creator_id)
+        )
         return self.db.scalar(stmt) or 0
 
+    def approx_count_by_creator(self, creator_id: uuid.UUID) -> int:
+        """
+        Estimate the number of chain strategies created by a user from the query plan.
+
+        Args:
+            creator_id: The ID of the creator
+
+        Returns:
+            The estimated number of chain strategies created by the user
+        """
+        return self._estimate_count(
+            select(ChainStrategy.id).where(ChainStrategy.created_by_id == creator_id)
+        )
+
     def add_node_to_strategy(
         self, strategy_id: uuid.UUID, node_id: uuid.UUID, position: int, config: dict = None
     ) -> StrategyNode:
         """
         Add a node to a chain strategy.
 
+        Idempotent: adding the same node at the same position again is a
+        no-op that returns the existing link. The link is not committed.
+
         Args:
             strategy_id: The chain strategy ID
             node_id: The node ID
@@ -127,42 +191,79 @@ class ChainRepository(BaseRepository[ChainStrategy]):
             config: Optional node configuration
 
         Returns:
-            The created strategy node link
+            The created or existing strategy node link
         """
-        strategy_node = StrategyNode(
-            strategy_id=strategy_id,
-            node_id=node_id,
-            position=position,
-            config=config or {},
+        # One atomic statement instead of check-then-insert
+        stmt = (
+            pg_insert(StrategyNode)
+            .values(
+                strategy_id=strategy_id,
+                node_id=node_id,
+                position=position,
+                config=config or {},
+            )
+            .on_conflict_do_nothing(index_elements=["strategy_id", "node_id", "position"])
+            .returning(StrategyNode)
         )
-        self.db.add(strategy_node)
-        self.db.commit()
-        self.db.refresh(strategy_node)
+        strategy_node = self.db.scalars(stmt).one_or_none()
+        if strategy_node is None:
+            strategy_node = self.db.scalars(
+                select(StrategyNode).where(
+                    StrategyNode.strategy_id == strategy_id,
+                    StrategyNode.node_id == node_id,
+                    StrategyNode.position == position,
+                )
+            ).one()
         return strategy_node
 
-    def remove_node_from_strategy(self, strategy_id: uuid.UUID, node_id: uuid.UUID) -> bool:
+    def add_nodes_to_strategy(
+        self, strategy_id: uuid.UUID, items: List[Dict[str, Any]]
+    ) -> List[StrategyNode]:
+        """
+        Add several nodes to a chain strategy in batched multi-row INSERTs.
+
+        The links are not committed.
+
+        Args:
+            strategy_id: The chain strategy ID
+            items: One dict per node with ``node_id``, ``position`` and
+                optionally ``config``
+
+        Returns:
+            The created strategy node links
+        """
+        rows = [
+            {
+                "strategy_id": strategy_id,
+                "node_id": item["node_id"],
+                "position": item["position"],
+                "config": item.get("config") or {},
+            }
+            for item in items
+        ]
+        return self._insert_many(StrategyNode, rows)
+
+    def remove_node_from_strategy(
+        self, strategy_id: uuid.UUID, node_id: uuid.UUID, position: Optional[int] = None
+    ) -> bool:
         """
         Remove a node from a chain strategy.
 
+        Without a position, every link to the node is removed, wherever it
+        appears in the chain. The delete is not committed.
+
         Args:
             strategy_id: The chain strategy ID
             node_id: The node ID
+            position: Optional position of the single link to remove
 
         Returns:
-            True if the node was removed, False otherwise
+            True if any link was removed, False otherwise
         """
-        stmt = (
-            select(StrategyNode)
-            .where(
-                and_(
-                    StrategyNode.strategy_id == strategy_id,
-                    StrategyNode.node_id == node_id,
-                )
-            )
+        stmt = delete(StrategyNode).where(
+            StrategyNode.strategy_id == strategy_id,
+            StrategyNode.node_id == node_id,
         )
-        strategy_node = self.db.scalar(stmt)
-        if strategy_node:
-            self.db.delete(strategy_node)
-            self.db.commit()
-            return True
-        return False 
\ No newline at end of file
+        if position is not None:
+            stmt = stmt.where(StrategyNode.position == position)
+        return self.db.execute(stmt.returning(StrategyNode.id)).first() is not None
@@ -4,19 +4,68 @@ Execution repository for the Chain Processing System.
 This module defines the repository for execution-related operations.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import enum
+import io
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import uuid
 
-from sqlalchemy import select, func, desc, and_, between
-from sqlalchemy.orm import Session, joinedload
+from chain_processor_core.utils.serialization import json_dumps_bytes
+from sqlalchemy import Row, insert, lambda_stmt, select, func, desc, between, update
+from sqlalchemy.orm import Session, selectinload
 
-from ..models.execution import ChainExecution, NodeExecution
-from .base import BaseRepository
+from ..models.execution import ChainExecution, ExecutionStatus, NodeExecution
+from .base import YIELD_PER, BaseRepository
+
+# Columns for list views; leaves out metadata and bookkeeping columns
+SUMMARY_COLUMNS = (
+    ChainExecution.id,
+    ChainExecution.strategy_id,
+    ChainExecution.input_text,
+    ChainExecution.output_text,
+    ChainExecution.error,
+    ChainExecution.status,
+    ChainExecution.execution_time_ms,
+    ChainExecution.started_at,
+    ChainExecution.completed_at,
+)
+
+
+def _copy_value(value: Any) -> str:
+    """Format a value as a field of PostgreSQL's COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, enum.Enum):
+        value = value.value
+    if isinstance(value, (dict, list)):
+        text = json_dumps_bytes(value).decode()
+    elif isinstance(value, datetime):
+        text = value.isoformat()
+    else:
+        text = str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
 
 
 class ExecutionRepository(BaseRepository[ChainExecution]):
-    """Repository for ChainExecution entities."""
+    """
+    Repository for ChainExecution entities.
+
+    Node executions can be written three ways:
+
+    - ``create_node_execution`` adds a single row and commits, like ``create``.
+    - ``create_node_executions`` inserts many rows with multi-row INSERTs and
+      returns the ORM objects; use it when the caller needs them.
+    - ``bulk_insert_node_executions`` streams rows with COPY and returns only
+      the count; use it for large backfills.
+
+    The batch writers and ``update_node_execution`` do not commit; the
+    caller commits once for the whole unit of work.
+    """
 
     def get_with_nodes(self, execution_id: uuid.UUID) -> Optional[ChainExecution]:
         """
@@ -30,7 +79,7 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
         """
         stmt = (
             select(ChainExecution)
-            .options(joinedload(ChainExecution.node_executions))
+            .options(selectinload(ChainExecution.node_executions))
             .where(ChainExecution.id == execution_id)
         )
         return self.db.scalar(stmt)
@@ -49,8 +98,8 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
         Returns:
             List of chain executions with the specified status
         """
-        stmt = (
-            select(ChainExecution)
+        stmt = lambda_stmt(
+            lambda: select(ChainExecution)
             .where(ChainExecution.status == status)
             .order_by(desc(ChainExecution.created_at))
             .limit(limit)
@@ -58,6 +107,53 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
         )
         return list(self.db.scalars(stmt).all())
 
+    def iter_by_status(
+        self, status: str, batch_size: int = YIELD_PER
+    ) -> Iterator[ChainExecution]:
+        """
+        Stream all chain executions with a status, e.g. to sweep stuck runs.
+
+        Args:
+            status: The execution status
+            batch_size: Number of rows to fetch per round trip
+
+        Yields:
+            Each chain execution with the specified status
+        """
+        stmt = (
+            select(ChainExecution)
+            .where(ChainExecution.status == status)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.scalars(stmt)
+
+    def get_summaries(
+        self,
+        strategy_id: Optional[uuid.UUID] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Row[Any]]:
+        """
+        Get summary rows of chain executions for list views, newest first.
+
+        Args:
+            strategy_id: Optional strategy ID to filter by
+            status: Optional status to filter by
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            Rows with the SUMMARY_COLUMNS attributes
+        """
+        stmt = select(*SUMMARY_COLUMNS)
+        if strategy_id is not None:
+            stmt = stmt.where(ChainExecution.strategy_id == strategy_id)
+        if status is not None:
+            stmt = stmt.where(ChainExecution.status == status)
+        stmt = stmt.order_by(desc(ChainExecution.created_at)).limit(limit).offset(offset)
+        return list(self.db.execute(stmt).all())
+
     def get_by_strategy(
         self, strategy_id: uuid.UUID, limit: int = 100, offset: int = 0
     ) -> List[ChainExecution]:
@@ -72,8 +168,8 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
         Returns:
             List of chain executions for the specified strategy
         """
-        stmt = (
-            select(ChainExecution)
+        stmt = lambda_stmt(
+            lambda: select(ChainExecution)
             .where(ChainExecution.strategy_id == strategy_id)
             .order_by(desc(ChainExecution.created_at))
             .limit(limit)
@@ -95,8 +191,8 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
         Returns:
             List of chain executions created by the specified user
         """
-        stmt = (
-            select(ChainExecution)
+        stmt = lambda_stmt(
+            lambda: select(ChainExecution)
             .where(ChainExecution.created_by_id == creator_id)
             .order_by(desc(ChainExecution.created_at))
             .limit(limit)
@@ -118,9 +214,9 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
         Returns:
             List of recent chain executions
         """
-        start_date = datetime.utcnow() - timedelta(days=days)
-        stmt = (
-            select(ChainExecution)
+        start_date = datetime.now(timezone.utc) - timedelta(days=days)
+        stmt = lambda_stmt(
+            lambda: select(ChainExecution)
             .where(ChainExecution.created_at >= start_date)
             .order_by(desc(ChainExecution.created_at))
             .limit(limit)
@@ -138,35 +234,26 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
         Returns:
             Dictionary with execution statistics
         """
-        where_clause = ChainExecution.strategy_id == strategy_id if strategy_id else True
-        
-        # Total count
-        total_stmt = select(func.count()).select_from(ChainExecution).where(where_clause)
-        total_count = self.db.scalar(total_stmt) or 0
-        
-        # Status counts
-        status_counts = {}
-        for status in ["pending", "in_progress", "success", "failed", "cancelled"]:
-            status_stmt = (
-                select(func.count())
-                .select_from(ChainExecution)
-                .where(and_(where_clause, ChainExecution.status == status))
-            )
-            status_counts[status] = self.db.scalar(status_stmt) or 0
-        
-        # Average execution time for successful executions
-        avg_time_stmt = (
-            select(func.avg(ChainExecution.execution_time_ms))
-            .select_from(ChainExecution)
-            .where(
-                and_(
-                    where_clause,
-                    ChainExecution.status == "success",
-                    ChainExecution.execution_time_ms.is_not(None),
-                )
+        # One grouped scan yields every count and the success average;
+        # avg() ignores rows without an execution time
+        stmt = (
+            select(
+                ChainExecution.status,
+                func.count(),
+                func.avg(ChainExecution.execution_time_ms),
             )
+            .group_by(ChainExecution.status)
         )
-        avg_execution_time = self.db.scalar(avg_time_stmt)
+        if strategy_id:
+            stmt = stmt.where(ChainExecution.strategy_id == strategy_id)
+
+        status_counts = {status.value: 0 for status in ExecutionStatus}
+        avg_execution_time = None
+        for status, count, avg_time in self.db.execute(stmt):
+            status_counts[ExecutionStatus(status).value] = count
+            if status == ExecutionStatus.SUCCESS:
+                avg_execution_time = avg_time
+        total_count = sum(status_counts.values())
         
         return {
             "total_count": total_count,
@@ -204,6 +291,60 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
         self.db.refresh(node_execution)
         return node_execution
 
+    def create_node_executions(self, rows: List[Dict[str, Any]]) -> List[NodeExecution]:
+        """
+        Create many node executions in batched multi-row INSERTs.
+
+        The rows are not committed.
+
+        Args:
+            rows: The node execution values, keyed by attribute name
+
+        Returns:
+            The created node executions
+        """
+        return self._insert_many(NodeExecution, rows)
+
+    def bulk_insert_node_executions(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many node executions at once, bypassing the ORM unit of work.
+
+        On PostgreSQL the rows are streamed with a single COPY; other
+        databases fall back to one executemany INSERT. Every row must have
+        the same keys, named after NodeExecution attributes (e.g.
+        ``metadata_json``). Omitted columns take their server defaults.
+        The rows are not committed.
+
+        Args:
+            rows: The node execution values to insert
+
+        Returns:
+            The number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        if self.db.get_bind().dialect.name != "postgresql":
+            self.db.execute(insert(NodeExecution), rows)
+            return len(rows)
+
+        attrs = list(rows[0])
+        mapper_attrs = NodeExecution.__mapper__.attrs
+        columns = ", ".join(mapper_attrs[attr].columns[0].name for attr in attrs)
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(_copy_value(row[attr]) for attr in attrs))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        # COPY runs on the session's own connection, inside its transaction
+        dbapi_connection = self.db.connection().connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {NodeExecution.__tablename__} ({columns}) FROM STDIN", buffer
+            )
+        return len(rows)
+
     def update_node_execution(
         self, 
         node_execution_id: uuid.UUID, 
@@ -215,6 +356,9 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
         """
         Update a node execution.
 
+        The update is not committed, so callers can apply many updates in a
+        single transaction and commit once.
+
         Args:
             node_execution_id: The node execution ID
             output_text: Optional output text
@@ -223,7 +367,8 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
             execution_time_ms: Optional execution time in milliseconds
 
         Returns:
-            The updated node execution if found, None otherwise
+            The updated node execution if found; None if it was not found or
+            there was nothing to update (no query is issued in that case)
         """
         data = {}
         if output_text is not None:
@@ -236,12 +381,11 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
             data["execution_time_ms"] = execution_time_ms
         
         if status in ["success", "failed", "cancelled"]:
-            data["completed_at"] = datetime.utcnow()
+            data["completed_at"] = datetime.now(timezone.utc)
             
         if not data:
-            # No updates to make
-            node_execution = self.db.get(NodeExecution, node_execution_id)
-            return node_execution
+            # Nothing to update, so skip the round trip
+            return None
             
         result = self.db.execute(
             update(NodeExecution)
@@ -249,5 +393,4 @@ class ExecutionRepository(BaseRepository[ChainExecution]):
             .values(**data)
             .returning(NodeExecution)
         )
-        self.db.commit()
         return result.scalar_one_or_none()
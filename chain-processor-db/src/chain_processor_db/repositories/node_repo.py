@@ -4,14 +4,18 @@ Node repository for the Chain Processing System.
 This module defines the repository for node-related operations.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import uuid
 
-from sqlalchemy import select, func
+from sqlalchemy import Row, func, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from ..models.node import Node
-from .base import BaseRepository
+from .base import BaseRepository, TagMatch, array_match
+
+
+# Columns for list views; leaves out the potentially large code body
+SUMMARY_COLUMNS = (Node.id, Node.name, Node.description, Node.tags, Node.version, Node.is_active)
 
 
 class NodeRepository(BaseRepository[Node]):
@@ -27,7 +31,7 @@ class NodeRepository(BaseRepository[Node]):
         Returns:
             The node if found, None otherwise
         """
-        stmt = select(Node).where(Node.name == name)
+        stmt = lambda_stmt(lambda: select(Node).where(Node.name == name))
         return self.db.scalar(stmt)
 
     def get_by_tag(self, tag: str, limit: int = 100, offset: int = 0) -> List[Node]:
@@ -42,9 +46,59 @@ class NodeRepository(BaseRepository[Node]):
         Returns:
             List of nodes with the specified tag
         """
-        stmt = select(Node).where(
-            Node.tags.contains([tag])
-        ).limit(limit).offset(offset)
+        tags = [tag]
+        stmt = lambda_stmt(
+            lambda: select(Node).where(Node.tags.contains(tags)).limit(limit).offset(offset)
+        )
+        return list(self.db.scalars(stmt).all())
+
+    def get_by_tags(
+        self, tags: List[str], mode: TagMatch = "any", limit: int = 100, offset: int = 0
+    ) -> List[Node]:
+        """
+        Get nodes matching several tags in one query.
+
+        Args:
+            tags: The tags to filter by
+            mode: "any" to match nodes with at least one of the tags,
+                "all" to match nodes with every tag
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            List of matching nodes
+
+        Raises:
+            ValueError: If the mode is not "any" or "all"
+        """
+        stmt = (
+            select(Node)
+            .where(array_match(Node.tags, tags, mode))
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(self.db.scalars(stmt).all())
+
+    def get_by_metadata_contains(
+        self, fragment: Dict[str, Any], limit: int = 100, offset: int = 0
+    ) -> List[Node]:
+        """
+        Get nodes whose metadata contains the given JSON fragment.
+
+        Args:
+            fragment: The key/value pairs the metadata must contain
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            List of nodes with matching metadata
+        """
+        stmt = lambda_stmt(
+            lambda: select(Node)
+            .where(Node.metadata_json.contains(fragment))
+            .limit(limit)
+            .offset(offset)
+        )
         return list(self.db.scalars(stmt).all())
 
     def get_active_nodes(self, limit: int = 100, offset: int = 0) -> List[Node]:
@@ -58,9 +112,40 @@ class NodeRepository(BaseRepository[Node]):
         Returns:
             List of active nodes
         """
-        stmt = select(Node).where(Node.is_active == True).limit(limit).offset(offset)
+        stmt = lambda_stmt(
+            lambda: select(Node).where(Node.is_active == True).limit(limit).offset(offset)
+        )
         return list(self.db.scalars(stmt).all())
 
+    def get_summaries(
+        self,
+        tag: Optional[str] = None,
+        active_only: bool = False,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Row[Any]]:
+        """
+        Get summary rows of nodes for list views.
+
+        Selecting columns instead of entities skips identity-map bookkeeping
+        and never loads the node code.
+
+        Args:
+            tag: Optional tag to filter by
+            active_only: Whether to return active nodes only
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            Rows with the SUMMARY_COLUMNS attributes
+        """
+        stmt = select(*SUMMARY_COLUMNS)
+        if tag is not None:
+            stmt = stmt.where(Node.tags.contains([tag]))
+        if active_only:
+            stmt = stmt.where(Node.is_active == True)
+        return list(self.db.execute(stmt.limit(limit).offset(offset)).all())
+
     def get_latest_version(self, name: str) -> Optional[Node]:
         """
         Get the latest version of a node by name.
@@ -71,8 +156,8 @@ class NodeRepository(BaseRepository[Node]):
         Returns:
             The latest version of the node if found, None otherwise
         """
-        stmt = (
-            select(Node)
+        stmt = lambda_stmt(
+            lambda: select(Node)
             .where(Node.name == name)
             .order_by(Node.version.desc())
             .limit(1)
@@ -83,11 +168,43 @@ class NodeRepository(BaseRepository[Node]):
         """
         Count the number of nodes created by a user.
 
+        This is an exact count; prefer ``approx_count_by_creator`` for
+        dashboards.
+
         Args:
             creator_id: The ID of the creator
 
         Returns:
             The number of nodes created by the user
         """
-        stmt = select(func.count()).select_from(Node).where(Node.created_by_id == creator_id)
-        return self.db.scalar(stmt) or 0 
\ No newline at end of file
+        stmt = lambda_stmt(
+            lambda: select(func.count()).select_from(Node).where(Node.created_by_id == creator_id)
+        )
+        return self.db.scalar(stmt) or 0
+
+    def approx_count_by_creator(self, creator_id: uuid.UUID) -> int:
+        """
+        Estimate the number of nodes created by a user from the query plan.
+
+        Args:
+            creator_id: The ID of the creator
+
+        Returns:
+            The estimated number of nodes created by the user
+        """
+        return self._estimate_count(select(Node.id).where(Node.created_by_id == creator_id))
+
+    def count(self, tag: Optional[str] = None) -> int:
+        """
+        Count nodes, optionally filtered by tag.
+
+        Args:
+            tag: Optional tag to filter by
+
+        Returns:
+            The number of matching nodes
+        """
+        stmt = select(func.count()).select_from(Node)
+        if tag is not None:
+            stmt = stmt.where(Node.tags.contains([tag]))
+        return self.db.scalar(stmt) or 0
@@ -4,16 +4,20 @@ User repository for the Chain Processing System.
 This module defines the repository for user-related operations.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import uuid
 
-from sqlalchemy import select, func
+from sqlalchemy import Row, func, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from ..models.user import User
 from .base import BaseRepository
 
 
+# Columns for list views; leaves out credentials and preferences
+SUMMARY_COLUMNS = (User.id, User.email, User.full_name, User.roles, User.is_active, User.version)
+
+
 class UserRepository(BaseRepository[User]):
     """Repository for User entities."""
 
@@ -27,7 +31,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             The user if found, None otherwise
         """
-        stmt = select(User).where(User.email == email)
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
         return self.db.scalar(stmt)
 
     def get_by_role(self, role: str, limit: int = 100, offset: int = 0) -> List[User]:
@@ -42,17 +46,73 @@ class UserRepository(BaseRepository[User]):
         Returns:
             List of users with the specified role
         """
-        stmt = select(User).where(
-            User.roles.contains([role])
-        ).limit(limit).offset(offset)
+        roles = [role]
+        stmt = lambda_stmt(
+            lambda: select(User).where(User.roles.contains(roles)).limit(limit).offset(offset)
+        )
+        return list(self.db.scalars(stmt).all())
+
+    def get_summaries(
+        self, role: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> List[Row[Any]]:
+        """
+        Get summary rows of users for list views.
+
+        Args:
+            role: Optional role to filter by
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            Rows with the SUMMARY_COLUMNS attributes
+        """
+        stmt = select(*SUMMARY_COLUMNS)
+        if role is not None:
+            stmt = stmt.where(User.roles.contains([role]))
+        return list(self.db.execute(stmt.limit(limit).offset(offset)).all())
+
+    def get_by_preferences_contains(
+        self, fragment: Dict[str, Any], limit: int = 100, offset: int = 0
+    ) -> List[User]:
+        """
+        Get users whose preferences contain the given JSON fragment.
+
+        Args:
+            fragment: The key/value pairs the preferences must contain
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            List of users with matching preferences
+        """
+        stmt = lambda_stmt(
+            lambda: select(User)
+            .where(User.preferences.contains(fragment))
+            .limit(limit)
+            .offset(offset)
+        )
         return list(self.db.scalars(stmt).all())
 
     def count_active_users(self) -> int:
         """
         Count the number of active users.
 
+        This is an exact count; prefer ``approx_count_active_users`` for
+        dashboards.
+
         Returns:
             The number of active users
         """
-        stmt = select(func.count()).select_from(User).where(User.is_active == True)
-        return self.db.scalar(stmt) or 0 
\ No newline at end of file
+        stmt = lambda_stmt(
+            lambda: select(func.count()).select_from(User).where(User.is_active == True)
+        )
+        return self.db.scalar(stmt) or 0
+
+    def approx_count_active_users(self) -> int:
+        """
+        Estimate the number of active users from the query plan.
+
+        Returns:
+            The estimated number of active users
+        """
+        return self._estimate_count(select(User.id).where(User.is_active == True)) 
\ No newline at end of file
@@ -6,13 +6,15 @@ and configuring the database connection.
 """
 
 import os
-from typing import AsyncGenerator, Generator, Optional
+from collections import Counter
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, Engine
+from sqlalchemy.engine.default import CacheStats
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import QueuePool
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from .base import chain_db_metadata as metadata
 
@@ -41,6 +43,89 @@ def get_connection_url() -> str:
     return db_url
 
 
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean flag such as "true"/"0" from the environment."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_pool_options(
+    pool_size: Optional[int] = None, max_overflow: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get the connection pool options for an engine.
+
+    The defaults suit roughly 25-50 concurrent requests. Setting
+    DATABASE_NULL_POOL disables app-side pooling, for deployments that
+    run behind pgbouncer in transaction mode.
+
+    Args:
+        pool_size: The number of connections to keep in the pool. If not provided, it will be read from the environment.
+        max_overflow: The maximum number of connections to create above the pool_size. If not provided, it will be read from the environment.
+
+    Returns:
+        Keyword arguments for create_engine / create_async_engine
+    """
+    if _env_flag("DATABASE_NULL_POOL", False):
+        return {"poolclass": NullPool}
+
+    if pool_size is None:
+        pool_size = int(os.environ.get("DATABASE_POOL_SIZE", "25"))
+
+    if max_overflow is None:
+        max_overflow = int(os.environ.get("DATABASE_MAX_OVERFLOW", "25"))
+
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        # Fail fast instead of queueing requests behind an exhausted pool
+        "pool_timeout": float(os.environ.get("DATABASE_POOL_TIMEOUT", "10")),
+        # LIFO reuses the most recent connections, keeping their backends warm
+        # and letting idle extras time out
+        "pool_use_lifo": _env_flag("DATABASE_POOL_LIFO", True),
+        "pool_recycle": 300,  # Recycle connections after 5 minutes
+    }
+
+
+# Compiled-statement cache outcomes across all engines, by CacheStats name
+_cache_stats: Counter[str] = Counter()
+
+
+def _count_cache_hit(conn: Any, cursor: Any, statement: Any, parameters: Any, context: Any, executemany: bool) -> None:
+    """Record whether a statement's compiled form came from the cache."""
+    if context is not None:
+        _cache_stats[context.cache_hit.name] += 1
+
+
+def _get_query_cache_size() -> int:
+    """
+    Get the size of the engine's compiled-statement cache.
+
+    The default of 2000 (SQLAlchemy uses 500) leaves room for every
+    repository query and its variants, so hot statements aren't evicted.
+    """
+    return int(os.environ.get("DATABASE_QUERY_CACHE_SIZE", "2000"))
+
+
+def get_compiled_cache_stats() -> Dict[str, Any]:
+    """
+    Get hit/miss counts for the compiled-statement cache.
+
+    Returns:
+        The hit and miss counts and the hit ratio over cacheable statements
+    """
+    hits = _cache_stats[CacheStats.CACHE_HIT.name]
+    misses = _cache_stats[CacheStats.CACHE_MISS.name]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / total if total else None,
+    }
+
+
 def create_database_engine(
     connection_url: Optional[str] = None, pool_size: Optional[int] = None, max_overflow: Optional[int] = None
 ) -> Engine:
@@ -56,26 +141,14 @@ def create_database_engine(
         SQLAlchemy Engine
     """
     conn_url = connection_url or get_connection_url()
-    
-    # Get pool size and max overflow from environment variables if not provided
-    if pool_size is None:
-        pool_size_str = os.environ.get("DATABASE_POOL_SIZE", "10")
-        pool_size = int(pool_size_str)
-    
-    if max_overflow is None:
-        max_overflow_str = os.environ.get("DATABASE_MAX_OVERFLOW", "20")
-        max_overflow = int(max_overflow_str)
-    
-    # Create engine with connection pooling
+    options = get_pool_options(pool_size, max_overflow)
+    if "poolclass" not in options:
+        options["poolclass"] = QueuePool
+
     engine = create_engine(
-        conn_url,
-        poolclass=QueuePool,
-        pool_size=pool_size,
-        max_overflow=max_overflow,
-        pool_recycle=300,  # Recycle connections after 5 minutes
-        pool_pre_ping=True,  # Check connection validity before using
+        conn_url, pool_pre_ping=True, query_cache_size=_get_query_cache_size(), **options
     )
-    
+    event.listen(engine, "before_cursor_execute", _count_cache_hit)
     return engine
 
 
@@ -134,4 +207,101 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+
+def get_async_connection_url() -> str:
+    """Get the database connection URL for the asyncpg driver."""
+    db_url = os.environ.get("ASYNC_DATABASE_URL")
+    if db_url:
+        return db_url
+    db_url = get_connection_url()
+    # Swap the (possibly implicit) sync driver for asyncpg
+    scheme, _, rest = db_url.partition("://")
+    if scheme.split("+")[0] in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    return db_url
+
+
+def create_async_database_engine(
+    connection_url: Optional[str] = None, pool_size: Optional[int] = None, max_overflow: Optional[int] = None
+) -> AsyncEngine:
+    """
+    Create an async SQLAlchemy database engine.
+
+    Args:
+        connection_url: The database connection URL. If not provided, it will be read from the environment.
+        pool_size: The number of connections to keep in the pool. If not provided, it will be read from the environment.
+        max_overflow: The maximum number of connections to create above the pool_size. If not provided, it will be read from the environment.
+
+    Returns:
+        SQLAlchemy AsyncEngine
+    """
+    conn_url = connection_url or get_async_connection_url()
+    engine = create_async_engine(
+        conn_url,
+        pool_pre_ping=True,
+        query_cache_size=_get_query_cache_size(),
+        **get_pool_options(pool_size, max_overflow),
+    )
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_cache_hit)
+    return engine
+
+
+# Create a global async engine for the application
+_async_engine: Optional[AsyncEngine] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the async database engine, creating it if it doesn't exist."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_database_engine()
+    return _async_engine
+
+
+def create_async_session_factory(
+    engine: Optional[AsyncEngine] = None,
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Create a SQLAlchemy async_sessionmaker.
+
+    Sessions do not expire objects on commit, since lazy-refreshing an
+    expired attribute would need an implicit await.
+
+    Args:
+        engine: The async database engine. If not provided, the global async engine will be used.
+
+    Returns:
+        SQLAlchemy async_sessionmaker
+    """
+    engine = engine or get_async_engine()
+    return async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+# Create a global async session factory
+_async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the async session factory, creating it if it doesn't exist."""
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = create_async_session_factory()
+    return _async_session_factory
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get an async database session from the async session factory.
+    This function is meant to be used as a FastAPI dependency in async routes.
+
+    Yields:
+        A SQLAlchemy AsyncSession
+    """
+    async with get_async_session_factory()() as db:
+        yield db
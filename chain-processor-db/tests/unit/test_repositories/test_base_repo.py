@@ -0,0 +1,41 @@
+"""
+Tests for the BaseRepository helpers.
+"""
+
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from chain_processor_db.models.node import Node
+from chain_processor_db.models.user import User
+from chain_processor_db.repositories.base import _explain_sql
+from chain_processor_db.repositories.node_repo import NodeRepository
+
+
+def test_explain_sql_renders_parameters_inline():
+    """Test that UUID and string array parameters are rendered into the EXPLAIN."""
+    creator_id = uuid.uuid4()
+    stmt = select(Node.id).where(Node.created_by_id == creator_id, Node.tags.contains(["a"]))
+    sql = _explain_sql(stmt, postgresql.dialect())
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert f"'{creator_id}'" in sql
+
+
+def test_explain_sql_unrenderable_parameter():
+    """Test that a parameter with no literal form gives None instead of raising."""
+    stmt = select(User.id).where(User.preferences.contains({"theme": "dark"}))
+    assert _explain_sql(stmt, postgresql.dialect()) is None
+
+
+def test_approx_count_falls_back_to_exact_count(db_session, sample_node):
+    """Test that approx_count counts exactly outside PostgreSQL."""
+    repo = NodeRepository(db_session)
+    assert repo.approx_count() == 1
+
+
+def test_estimate_count_falls_back_to_exact_count(db_session, sample_user, sample_node):
+    """Test that plan-based estimates count exactly outside PostgreSQL."""
+    repo = NodeRepository(db_session)
+    assert repo.approx_count_by_creator(sample_user.id) == 1
+    assert repo.approx_count_by_creator(uuid.uuid4()) == 0
@@ -0,0 +1,102 @@
+"""
+Tests for the ChainRepository class.
+"""
+
+from sqlalchemy import inspect, select
+
+from chain_processor_db.models.chain import StrategyNode
+from chain_processor_db.repositories import base
+from chain_processor_db.repositories.chain_repo import ChainRepository
+
+
+def _positions(db_session, strategy_id, node_id):
+    """Get the positions at which a node is linked into a strategy."""
+    stmt = (
+        select(StrategyNode.position)
+        .where(StrategyNode.strategy_id == strategy_id, StrategyNode.node_id == node_id)
+        .order_by(StrategyNode.position)
+    )
+    return list(db_session.scalars(stmt))
+
+
+def test_remove_node_from_strategy_removes_every_position(
+    db_session, sample_strategy, sample_node, sample_strategy_node
+):
+    """Test that removing a node without a position removes all of its links."""
+    repo = ChainRepository(db_session)
+    repo.add_node_to_strategy(sample_strategy.id, sample_node.id, position=1)
+    repo.add_node_to_strategy(sample_strategy.id, sample_node.id, position=2)
+    assert _positions(db_session, sample_strategy.id, sample_node.id) == [0, 1, 2]
+
+    assert repo.remove_node_from_strategy(sample_strategy.id, sample_node.id) is True
+    assert _positions(db_session, sample_strategy.id, sample_node.id) == []
+
+
+def test_remove_node_from_strategy_at_position(
+    db_session, sample_strategy, sample_node, sample_strategy_node
+):
+    """Test that passing a position removes only that link."""
+    repo = ChainRepository(db_session)
+    repo.add_node_to_strategy(sample_strategy.id, sample_node.id, position=1)
+
+    assert repo.remove_node_from_strategy(sample_strategy.id, sample_node.id, position=1) is True
+    assert _positions(db_session, sample_strategy.id, sample_node.id) == [0]
+
+
+def test_remove_node_from_strategy_not_found(db_session, sample_strategy, sample_node):
+    """Test removing a node that is not in the strategy."""
+    repo = ChainRepository(db_session)
+    assert repo.remove_node_from_strategy(sample_strategy.id, sample_node.id) is False
+
+
+def test_add_node_to_strategy(db_session, sample_strategy, sample_node):
+    """Test the add_node_to_strategy method."""
+    repo = ChainRepository(db_session)
+    link = repo.add_node_to_strategy(
+        sample_strategy.id, sample_node.id, position=0, config={"key": "value"}
+    )
+    assert link.id is not None
+    assert link.strategy_id == sample_strategy.id
+    assert link.node_id == sample_node.id
+    assert link.position == 0
+    assert link.config == {"key": "value"}
+
+
+def test_add_node_to_strategy_twice_returns_existing_link(
+    db_session, sample_strategy, sample_node
+):
+    """Test that adding the same link again returns the existing row."""
+    repo = ChainRepository(db_session)
+    first = repo.add_node_to_strategy(sample_strategy.id, sample_node.id, position=0)
+    second = repo.add_node_to_strategy(sample_strategy.id, sample_node.id, position=0)
+    assert second.id == first.id
+    assert _positions(db_session, sample_strategy.id, sample_node.id) == [0]
+
+
+def test_add_nodes_to_strategy_returns_every_row(
+    db_session, sample_strategy, sample_node, monkeypatch
+):
+    """Test that the batch insert returns a link for every item, across batches."""
+    monkeypatch.setattr(base, "INSERT_BATCH_SIZE", 2)
+    repo = ChainRepository(db_session)
+    items = [{"node_id": sample_node.id, "position": position} for position in range(3)]
+    links = repo.add_nodes_to_strategy(sample_strategy.id, items)
+    assert len(links) == 3
+    assert len({link.id for link in links}) == 3
+    assert sorted(link.position for link in links) == [0, 1, 2]
+    assert all(link.config == {} for link in links)
+    assert _positions(db_session, sample_strategy.id, sample_node.id) == [0, 1, 2]
+
+
+def test_get_with_nodes_preloads_links(db_session, sample_strategy, sample_strategy_node):
+    """Test that get_with_nodes loads the node links and plain loads do not."""
+    repo = ChainRepository(db_session)
+    db_session.expunge_all()
+    strategy = repo.get_by_id(sample_strategy.id)
+    assert "strategy_nodes" in inspect(strategy).unloaded
+
+    db_session.expunge_all()
+    strategy = repo.get_with_nodes(sample_strategy.id)
+    assert "strategy_nodes" not in inspect(strategy).unloaded
+    assert [link.id for link in strategy.strategy_nodes] == [sample_strategy_node.id]
+    assert strategy.strategy_nodes[0].node.id == sample_strategy_node.node_id
@@ -0,0 +1,72 @@
+"""
+Tests for the ExecutionRepository class.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from chain_processor_db.models.execution import ExecutionStatus, NodeExecution
+from chain_processor_db.repositories.execution_repo import ExecutionRepository, _copy_value
+
+
+def test_copy_value_none():
+    """Test that None is written as COPY's NULL marker."""
+    assert _copy_value(None) == "\\N"
+
+
+def test_copy_value_escapes_special_characters():
+    """Test that backslashes, tabs and line breaks are escaped."""
+    assert _copy_value("a\tb\nc\\d\re") == "a\\tb\\nc\\\\d\\re"
+
+
+def test_copy_value_does_not_confuse_text_with_null():
+    """Test that a literal \\N string is not read back as NULL."""
+    assert _copy_value("\\N") == "\\\\N"
+
+
+def test_copy_value_enum():
+    """Test that enums are written as their value."""
+    assert _copy_value(ExecutionStatus.SUCCESS) == "success"
+
+
+def test_copy_value_aware_datetime():
+    """Test that datetimes keep their UTC offset."""
+    value = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+    assert _copy_value(value) == "2024-01-01T12:30:00+00:00"
+
+
+def test_copy_value_dict():
+    """Test that dicts are written as escaped JSON."""
+    assert _copy_value({"text": "a\tb", "n": 1}) == '{"text":"a\\\\tb","n":1}'
+
+
+def test_bulk_insert_node_executions(db_session, sample_chain_execution, sample_node):
+    """Test the executemany fallback used outside PostgreSQL."""
+    repo = ExecutionRepository(db_session)
+    rows = [
+        {
+            "execution_id": sample_chain_execution.id,
+            "node_id": sample_node.id,
+            "input_text": f"line one\n\tline {i}",
+            "status": ExecutionStatus.SUCCESS,
+            "metadata_json": {"index": i},
+        }
+        for i in range(3)
+    ]
+    assert repo.bulk_insert_node_executions(rows) == 3
+
+    inserted = db_session.scalars(
+        select(NodeExecution)
+        .where(NodeExecution.execution_id == sample_chain_execution.id)
+        .order_by(NodeExecution.input_text)
+    ).all()
+    assert [n.input_text for n in inserted] == [row["input_text"] for row in rows]
+    assert all(n.status == ExecutionStatus.SUCCESS for n in inserted)
+    assert [n.metadata_json for n in inserted] == [{"index": i} for i in range(3)]
+
+
+def test_bulk_insert_node_executions_empty(db_session):
+    """Test that an empty batch issues no INSERT."""
+    repo = ExecutionRepository(db_session)
+    assert repo.bulk_insert_node_executions([]) == 0
@@ -0,0 +1,20 @@
+"""
+Tests for the NodeRepository class.
+"""
+
+from chain_processor_db.repositories.node_repo import NodeRepository
+
+
+def test_count(db_session, sample_node):
+    """Test the count method with and without a tag."""
+    repo = NodeRepository(db_session)
+    assert repo.count() == 1
+    assert repo.count(tag="test") == 1
+    assert repo.count(tag="missing") == 0
+
+
+def test_count_matches_summaries(db_session, sample_node):
+    """Test that count and get_summaries agree for the same filter."""
+    repo = NodeRepository(db_session)
+    for tag in (None, "uppercase", "missing"):
+        assert repo.count(tag=tag) == len(repo.get_summaries(tag=tag))
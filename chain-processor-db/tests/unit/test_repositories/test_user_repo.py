@@ -84,10 +84,10 @@ def test_update(db_session, sample_user):
     assert fetched_user.full_name == "Updated Name"
 
 
-def test_update_not_found(db_session):
+def test_update_not_found(db_session, unknown_uuid):
     """Test the update method with a non-existent user."""
     repo = UserRepository(db_session)
-    updated = repo.update(uuid.uuid4(), {"full_name": "Updated Name"})
+    updated = repo.update(unknown_uuid, {"full_name": "Updated Name"})
     assert updated is None
 
 
@@ -102,10 +102,10 @@ def test_delete(db_session, sample_user):
     assert fetched_user is None
 
 
-def test_delete_not_found(db_session):
+def test_delete_not_found(db_session, unknown_uuid):
     """Test the delete method with a non-existent user."""
     repo = UserRepository(db_session)
-    result = repo.delete(uuid.uuid4())
+    result = repo.delete(unknown_uuid)
     assert result is False
 
 
@@ -115,18 +115,24 @@ def test_count_active_users(db_session, sample_user):
     count = repo.count_active_users()
     assert count == 1
     
-    # Create an inactive user
-    inactive_user = User(
-        email="inactive@example.com",
-        password_hash="hashed_password",
-        full_name="Inactive User",
-        is_active=False,
-        is_superuser=False,
-        roles=["user"],
+    # Seed inactive users in one batch; ids are generated client-side
+    db_session.bulk_insert_mappings(
+        User,
+        [
+            {
+                "id": uuid.uuid4(),
+                "email": f"inactive{i}@example.com",
+                "password_hash": "hashed_password",
+                "full_name": f"Inactive User {i}",
+                "is_active": False,
+                "is_superuser": False,
+                "roles": ["user"],
+            }
+            for i in range(3)
+        ],
     )
-    db_session.add(inactive_user)
-    db_session.commit()
+    db_session.flush()
     
     # Count should still be 1
     count = repo.count_active_users()
-    assert count == 1 
\ No newline at end of file
+    assert count == 1
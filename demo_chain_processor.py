@@ -22,8 +22,13 @@ import json
 import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -35,25 +40,42 @@ API_URL = "http://10.10.10.187:8095/api"
 SAMPLE_TEXT = "Hello world! This is a demonstration of the Chain Processor API."
 VERBOSE = True  # Set to False for less output
 
+# One session for every call, so connections to the API are kept alive and reused
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.2),  # Retries idempotent requests only
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Concurrent API calls; keep at or below the adapter's pool_maxsize
+MAX_WORKERS = 8
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
 def print_response(response, message=None):
     """Print a formatted API response with optional message."""
-    if message and VERBOSE:
-        print(f"\n=== {message} ===")
-    
-    if VERBOSE:
-        print(f"Status Code: {response.status_code}")
-        if response.status_code >= 400:
-            print("Error:")
+    if not VERBOSE:
+        return
     
+    if message:
+        print(f"\n=== {message} ===")
+    print(f"Status Code: {response.status_code}")
+    if response.status_code >= 400:
+        print("Error:")
+        print(response.text)
+
+def parse_json(response):
+    """Decode a response body as JSON, or return None if it is empty or not JSON."""
+    if not response.content:
+        return None
     try:
         return response.json()
-    except:
-        if VERBOSE:
-            print(response.text)
+    except ValueError:
         return None
 
 def print_separator():
@@ -64,7 +86,7 @@ def print_separator():
 def check_api_health():
     """Check if the API is running and healthy."""
     try:
-        health_check = requests.get(f"{API_URL.rsplit('/api', 1)[0]}/health")
+        health_check = SESSION.get(f"{API_URL.rsplit('/api', 1)[0]}/health")
         if health_check.status_code != 200:
             print("API is not running or health check failed.")
             sys.exit(1)
@@ -76,26 +98,45 @@ def check_api_health():
 # Node Registration Functions
 # =============================================================================
 
+# These listings don't change during a run, so each is fetched at most once.
+# Call get_db_nodes.cache_clear() after creating nodes through the API.
+
+@lru_cache(maxsize=None)
+def get_db_nodes():
+    """Get the nodes stored in the database."""
+    response = SESSION.get(f"{API_URL}/nodes/")
+    print_response(response, "Current Database Nodes")
+    result = parse_json(response)
+    # The endpoint is paginated
+    if isinstance(result, dict):
+        return result.get("items", [])
+    return result or []
+
+@lru_cache(maxsize=None)
+def get_available_nodes():
+    """Get the node types available in the registry."""
+    response = SESSION.get(f"{API_URL}/nodes/available")
+    print_response(response, "Available Node Types from Registry")
+    return parse_json(response) or []
+
 def register_nodes_in_database():
     """Register built-in nodes from registry to database."""
     print_separator()
     print("STEP 1: REGISTER NODES IN DATABASE")
     
     # First check if nodes are already in database
-    response = requests.get(f"{API_URL}/nodes/")
-    db_nodes = print_response(response, "Current Database Nodes")
+    db_nodes = get_db_nodes()
     
-    if db_nodes and len(db_nodes) > 0:
+    if db_nodes:
         print(f"\nFound {len(db_nodes)} nodes already in database.")
         return {node['name']: node['id'] for node in db_nodes}
     
     print("\nNo nodes found in database. Creating sample nodes...")
     
     # Check available node types in registry
-    response = requests.get(f"{API_URL}/nodes/available")
-    available_nodes = print_response(response, "Available Node Types from Registry")
+    available_nodes = get_available_nodes()
     
-    if not available_nodes or len(available_nodes) == 0:
+    if not available_nodes:
         print("No nodes available in registry. Please ensure nodes are properly imported.")
         print("Add 'from . import text_processing' to chain_processor_core/src/chain_processor_core/nodes/__init__.py")
         sys.exit(1)
@@ -127,8 +168,9 @@ def create_chain_strategy():
         "tags": ["demo", "text", "processing"]
     }
     
-    response = requests.post(f"{API_URL}/chains/", json=chain_data)
-    result = print_response(response, "Chain Creation Result")
+    response = SESSION.post(f"{API_URL}/chains/", json=chain_data)
+    print_response(response, "Chain Creation Result")
+    result = parse_json(response)
     
     if not result or response.status_code != 200:
         print("Failed to create chain strategy. Exiting.")
@@ -167,18 +209,22 @@ def add_nodes_to_chain(chain_id, db_nodes):
         print("No nodes found to add to chain. Exiting.")
         sys.exit(1)
     
-    # Add each node to the chain
-    for position, (node_name, node_id) in enumerate(node_chain, 1):
-        print(f"Adding node: {node_name} at position {position}")
-        
+    def add_one(position, node_id):
         node_data = {
             "node_id": node_id,
             "position": position,
             "config": {}  # Empty config for simple nodes
         }
-        
-        response = requests.post(f"{API_URL}/chains/{chain_id}/nodes", json=node_data)
-        
+        return SESSION.post(f"{API_URL}/chains/{chain_id}/nodes", json=node_data)
+    
+    # Each request carries its own position, so they can all be in flight at once;
+    # the worker count stays within the session's connection pool
+    positions = range(1, len(node_chain) + 1)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        responses = list(pool.map(add_one, positions, [node_id for _, node_id in node_chain]))
+    
+    for position, (node_name, _), response in zip(positions, node_chain, responses):
+        print(f"Adding node: {node_name} at position {position}")
         if response.status_code == 201:
             print(f"Successfully added {node_name} to chain at position {position}")
         else:
@@ -203,8 +249,9 @@ def execute_chain(chain_id, input_text, db_nodes):
         "input_text": input_text
     }
     
-    response = requests.post(f"{API_URL}/chains/{chain_id}/execute", json=execution_data)
-    result = print_response(response, "Chain Execution Result")
+    response = SESSION.post(f"{API_URL}/chains/{chain_id}/execute", json=execution_data)
+    print_response(response, "Chain Execution Result")
+    result = parse_json(response)
     
     if not result or response.status_code != 200:
         print("Chain execution failed.")
@@ -220,16 +267,10 @@ def execute_chain(chain_id, input_text, db_nodes):
     print(f"Total Execution Time: {result['execution_time_ms']}ms")
     
     print("\nNode Results:")
+    # Map node IDs back to names for clearer output
+    id_to_name = {id_val: name for name, id_val in db_nodes.items()}
     for node_result in result.get("node_results", []):
-        # Try to map node IDs back to names for clearer output
-        node_id = node_result['node_id']
-        node_name = "Unknown"
-        
-        for name, id_val in db_nodes.items():
-            if id_val == node_id:
-                node_name = name
-                break
-                
+        node_name = id_to_name.get(node_result['node_id'], "Unknown")
         print(f"- Node: {node_name}")
         print(f"  Input: {node_result['input_text']}")
         print(f"  Output: {node_result['output_text']}")
@@ -252,8 +293,8 @@ def main():
     # If no nodes were found and registration was skipped
     if not db_nodes:
         # Try to get nodes again in case they were manually registered
-        response = requests.get(f"{API_URL}/nodes/")
-        db_nodes = {node['name']: node['id'] for node in response.json()}
+        get_db_nodes.cache_clear()
+        db_nodes = {node['name']: node['id'] for node in get_db_nodes()}
     
     if not db_nodes:
         print("No nodes available. Please register nodes and try again.")